@@ -1,7 +1,7 @@
 import json
 import sys
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QCoreApplication, QObject, Qt
 from PySide6.QtWidgets import QApplication
 
 from app.controllers.main_window_controller import MainWindowController
@@ -20,6 +20,8 @@ class AppController(QObject):
     def __init__(self) -> None:
         super().__init__()
 
+        # Required for Qt WebEngine, which is imported lazily by the workshop browser
+        QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
         self.app = QApplication(sys.argv)
 
         self.app.setStyle("Fusion")
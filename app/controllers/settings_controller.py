@@ -53,6 +53,9 @@ class SettingsController(QObject):
 
         self._last_file_dialog_path = str(Path.home())
 
+        # Cached (config folder, Player.log path) for the current instance
+        self._player_log_path: tuple[str, Path] | None = None
+
         # Initialize the settings dialog from the settings model
 
         self._update_view_from_model()
@@ -229,6 +232,22 @@ class SettingsController(QObject):
             ),
         ]
 
+    @property
+    def player_log_path(self) -> Path:
+        """
+        Path to RimWorld's Player.log for the current instance, which lives next to
+        the config folder. Rebuilt only when the config folder changes.
+        """
+        config_folder = self.settings.instances[
+            self.settings.current_instance
+        ].config_folder
+        if self._player_log_path is None or self._player_log_path[0] != config_folder:
+            self._player_log_path = (
+                config_folder,
+                Path(config_folder).parent / "Player.log",
+            )
+        return self._player_log_path[1]
+
     def resolve_data_source(self, path: str) -> str | None:
         """
         Resolve the data source for the provided path string.
@@ -1,3 +1,4 @@
+from itertools import chain
 from typing import Callable
 
 from loguru import logger
@@ -40,11 +41,12 @@ class Sorter:
         self,
     ) -> list[dict[str, set[str]]]:
         logger.info("Generating dependency graphs")
-        dependencies_graph = sort_deps.gen_deps_graph(
-            self.active_uuids, list(self.active_package_ids)
-        )
+        # Resolve packageids once and share them between the graph builders
+        uuid_to_pid = sort_deps.gen_uuid_to_pid(self.active_uuids)
+        active_mod_ids = set(self.active_package_ids)
+        dependencies_graph = sort_deps.gen_deps_graph(uuid_to_pid, active_mod_ids)
         reverse_dependencies_graph = sort_deps.gen_rev_deps_graph(
-            self.active_uuids, list(self.active_package_ids)
+            uuid_to_pid, active_mod_ids
         )
 
         tier_one_graph, tier_one_mods = sort_deps.gen_tier_one_deps_graph(
@@ -58,8 +60,8 @@ class Sorter:
         )
 
         tier_two_graph = sort_deps.gen_tier_two_deps_graph(
-            self.active_uuids,
-            list(self.active_package_ids),
+            uuid_to_pid,
+            active_mod_ids,
             tier_one_mods,
             tier_three_mods,
         )
@@ -79,15 +81,16 @@ class Sorter:
         if dependency_graphs is None:
             dependency_graphs = self.generate_dependency_graphs()
 
-        sorted_uuids = []
+        sorted_tiers: list[list[str]] = []
         try:
             for i, graph in enumerate(dependency_graphs):
                 logger.info(f"Sorting tier {i + 1}")
                 sorted_mods = self.sort_method(graph, self.active_uuids)
                 logger.info(f"Tier {i + 1} sorted: {len(sorted_mods)}")
-                sorted_uuids += sorted_mods
+                sorted_tiers.append(sorted_mods)
         except CircularDependencyError:
             logger.info("Circular dependency detected, abandoning sort")
             return False, []
 
-        return True, list(dict.fromkeys(sorted_uuids))
+        # Dedupe while keeping the first occurrence, without concatenating the tiers
+        return True, list(dict.fromkeys(chain.from_iterable(sorted_tiers)))
@@ -3,26 +3,33 @@ from loguru import logger
 from app.utils.metadata import MetadataManager
 
 
+def gen_uuid_to_pid(active_mods_uuids: set[str]) -> dict[str, str]:
+    """
+    Map each active mod uuid to its packageid, so the graph builders below
+    do not have to repeat the metadata lookup for every mod.
+    """
+    internal_local_metadata = MetadataManager.instance().internal_local_metadata
+    return {
+        uuid: internal_local_metadata[uuid]["packageid"] for uuid in active_mods_uuids
+    }
+
+
 def gen_deps_graph(
-    active_mods_uuids: set[str], active_mod_ids: list[str]
+    uuid_to_pid: dict[str, str], active_mod_ids: set[str]
 ) -> dict[str, set[str]]:
     """
     Get dependencies
     """
-    # Cache MetadataManager instance
-    metadata_manager = MetadataManager.instance()
+    # Cache metadata dict
+    internal_local_metadata = MetadataManager.instance().internal_local_metadata
     # Schema: {item: {dependency1, dependency2, ...}}
     logger.info("生成依赖关系图")
     dependencies_graph: dict[str, set[str]] = {}
-    for uuid in active_mods_uuids:
-        package_id = metadata_manager.internal_local_metadata[uuid]["packageid"]
+    for uuid, package_id in uuid_to_pid.items():
         dependencies_graph[package_id] = set()
-        if metadata_manager.internal_local_metadata[uuid].get(
-            "loadTheseBefore"
-        ):  # Will either be None, or a set
-            for dependency in metadata_manager.internal_local_metadata[uuid][
-                "loadTheseBefore"
-            ]:
+        load_these_before = internal_local_metadata[uuid].get("loadTheseBefore")
+        if load_these_before:  # Will either be None, or a set
+            for dependency in load_these_before:
                 # Only add a dependency if dependency exists in active_mods. Recall
                 # that dependencies exist for all_mods, but not all of these will be
                 # in active mods. Also note that dependencies here refers to load order
@@ -41,22 +48,18 @@ def gen_deps_graph(
 
 
 def gen_rev_deps_graph(
-    active_mods_uuids: set[str], active_mod_ids: list[str]
+    uuid_to_pid: dict[str, str], active_mod_ids: set[str]
 ) -> dict[str, set[str]]:
-    # Cache MetadataManager instance
-    metadata_manager = MetadataManager.instance()
+    # Cache metadata dict
+    internal_local_metadata = MetadataManager.instance().internal_local_metadata
     # Schema: {item: {isDependentOn1, isDependentOn2, ...}}
     logger.debug("生成反向依赖关系图")
     reverse_dependencies_graph: dict[str, set[str]] = {}
-    for uuid in active_mods_uuids:
-        package_id = metadata_manager.internal_local_metadata[uuid]["packageid"]
+    for uuid, package_id in uuid_to_pid.items():
         reverse_dependencies_graph[package_id] = set()
-        if metadata_manager.internal_local_metadata[uuid].get(
-            "loadTheseAfter"
-        ):  # Will either be None, or a set
-            for dependent in metadata_manager.internal_local_metadata[uuid][
-                "loadTheseAfter"
-            ]:
+        load_these_after = internal_local_metadata[uuid].get("loadTheseAfter")
+        if load_these_after:  # Will either be None, or a set
+            for dependent in load_these_after:
                 # Dependent[0] is required here as as dependency is a tuple of package_id, explicit_bool
                 if not isinstance(dependent, tuple):
                     logger.error(
@@ -202,27 +205,24 @@ def get_reverse_dependencies_recursive(
 
 
 def gen_tier_two_deps_graph(
-    active_mods_uuids: set[str],
-    active_mod_ids: list[str],
+    uuid_to_pid: dict[str, str],
+    active_mod_ids: set[str],
     tier_one_mods: set[str],
     tier_three_mods: set[str],
 ) -> dict[str, set[str]]:
     # Now, sort the rest of the mods while removing references to mods in tier one and tier three
     # First, get the dependency graph for tier two mods, minus all references to tier one
     # and tier three mods
-    # Cache MetadataManager instance
-    metadata_manager = MetadataManager.instance()
+    # Cache metadata dict
+    internal_local_metadata = MetadataManager.instance().internal_local_metadata
     logger.info("为第二层模组生成依赖关系图")
     logger.info(
         "剥离对第一层和第三层模组及其依赖项的所有引用"
     )
     tier_two_dependency_graph = {}
-    for uuid in active_mods_uuids:
-        package_id = metadata_manager.internal_local_metadata[uuid]["packageid"]
+    for uuid, package_id in uuid_to_pid.items():
         if package_id not in tier_one_mods and package_id not in tier_three_mods:
-            dependencies = metadata_manager.internal_local_metadata[uuid].get(
-                "loadTheseBefore"
-            )
+            dependencies = internal_local_metadata[uuid].get("loadTheseBefore")
             stripped_dependencies = set()
             if dependencies:
                 for dependency_id in dependencies:
@@ -5,16 +5,20 @@ import subprocess
 import sys
 import webbrowser
 from errno import EACCES
+from io import BytesIO
 from pathlib import Path
 from re import sub
 from stat import S_IRWXG, S_IRWXO, S_IRWXU
-from typing import Any, Callable, Generator
+from typing import IO, Any, Callable, Generator
+from uuid import uuid4
 
 import requests
 from loguru import logger
 from pyperclip import (  # type: ignore # Stubs don't exist for pyperclip
     copy as copy_to_clipboard,
 )
+from PySide6.QtCore import QMimeData
+from PySide6.QtGui import QGuiApplication
 from requests import post as requests_post
 
 import app.views.dialogue as dialogue
@@ -31,6 +35,20 @@ def chunks(_list: list[Any], limit: int) -> Generator[list[Any], None, None]:
         yield _list[i : i + limit]
 
 
+def even_chunks(_list: list[Any], num_chunks: int) -> list[list[Any]]:
+    """
+    Split list into num_chunks chunks whose sizes differ by at most 1
+
+    :param _list: a list to break into chunks
+    :param num_chunks: number of chunks to return
+    """
+    size, remainder = divmod(len(_list), num_chunks)
+    return [
+        _list[i * size + min(i, remainder) : (i + 1) * size + min(i + 1, remainder)]
+        for i in range(num_chunks)
+    ]
+
+
 def copy_to_clipboard_safely(text: str) -> None:
     """
     Safely copies text to clipboard
@@ -38,7 +56,14 @@ def copy_to_clipboard_safely(text: str) -> None:
     :param text: text to copy to clipboard
     """
     try:
-        copy_to_clipboard(text)
+        # Prefer Qt's clipboard while the app is running; it takes ownership of
+        # the MIME data and serves it in-process, even for large payloads
+        if QGuiApplication.instance() is not None:
+            mime_data = QMimeData()
+            mime_data.setText(text)
+            QGuiApplication.clipboard().setMimeData(mime_data)
+        else:
+            copy_to_clipboard(text)
     except Exception as e:
         logger.error(f"Failed to copy to clipboard: {e}")
         dialogue.show_fatal_error(
@@ -261,21 +286,74 @@ def flatten_to_list(obj: Any) -> list[Any] | dict[Any, Any] | Any:
         return obj
 
 
-def upload_data_to_0x0_st(path: str) -> tuple[bool, str]:
+class _MultipartFileBody:
+    """
+    A read-only, sized file-like multipart/form-data body for a single file.
+    The file is read from disk as the request is sent, instead of being
+    encoded into memory in full first.
+    """
+
+    def __init__(self, field: str, path: str | Path) -> None:
+        # Open first and size the open handle, so the path is only resolved once
+        file = open(path, "rb")
+        boundary = uuid4().hex
+        filename = os.path.basename(path)
+        head = (
+            f"--{boundary}\r\n"
+            + f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            + "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        tail = f"\r\n--{boundary}--\r\n".encode()
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._length = len(head) + os.fstat(file.fileno()).st_size + len(tail)
+        self._parts: list[IO[bytes]] = [BytesIO(head), file, BytesIO(tail)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        data: list[bytes] = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.pop(0).close()
+                continue
+            data.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(data)
+
+    def close(self) -> None:
+        for part in self._parts:
+            part.close()
+        self._parts.clear()
+
+
+def upload_data_to_0x0_st(path: str | Path) -> tuple[bool, str]:
     """
     Function to upload data to http://0x0.st/
 
-    :param path: a string path to a file containing data to upload
+    :param path: a path to a file containing data to upload
     :return: a string that is the URL returned from http://0x0.st/
     """
     logger.info(f"Uploading data to http://0x0.st/: {path}")
+    # Stream the file from disk so large logs are never held in memory in full
+    try:
+        body = _MultipartFileBody("file", path)
+    except FileNotFoundError:
+        logger.warning(f"File to upload does not exist: {path}")
+        return False, f"The file you are trying to upload does not exist: {path}"
     try:
         request = requests_post(
-            url="http://0x0.st/", files={"file": (path, open(path, "rb"))}
+            url="http://0x0.st/",
+            data=body,
+            headers={"Content-Type": body.content_type},
         )
     except requests.exceptions.ConnectionError as e:
         logger.error(f"连接错误。无法将数据上传到 http://0x0.st: {e}")
         return False, str(e)
+    finally:
+        body.close()
 
     if request.status_code == 200:
         url = request.text.strip()
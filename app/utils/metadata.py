@@ -1,5 +1,6 @@
 import json
 import os
+import pickle
 import traceback
 from pathlib import Path
 from re import match
@@ -16,6 +17,7 @@ from PySide6.QtCore import (
     QThreadPool,
     Signal,
 )
+from requests import Session
 
 from app.controllers.settings_controller import SettingsController
 from app.utils.app_info import AppInfo
@@ -33,13 +35,52 @@ from app.utils.steam.webapi.wrapper import (
     DynamicQuery,
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
-from app.utils.xml import json_to_xml_write, xml_path_to_json
+from app.utils.xml import (
+    json_to_xml_write,
+    xml_path_to_json,
+    xml_path_to_mods_list,
+)
 from app.views.dialogue import (
     show_dialogue_conditional,
     show_dialogue_file,
     show_warning,
 )
 
+
+def load_steam_db(path: str) -> dict[str, Any]:
+    """
+    Load a Steam DB, reusing a pickled copy of it while the JSON is unchanged
+
+    The pickle lives in the app storage folder, not next to the JSON, so the
+    database git repo stays clean. It is keyed on the JSON's path, size and
+    modification time, and rewritten whenever the JSON is parsed again.
+
+    :param path: path of the Steam DB JSON
+    :return: the decoded database
+    """
+    stat = os.stat(path)
+    stamp = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    cache_path = AppInfo().app_storage_folder / "steam_db_cache.pickle"
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, cached_db = pickle.load(f)
+        if cached_stamp == stamp:
+            logger.debug(f"Loaded Steam DB from cache: {cache_path}")
+            return cached_db
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable Steam DB cache {cache_path}: {e}")
+    with open(path, encoding="utf-8") as f:
+        db_data = json.load(f)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((stamp, db_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        logger.warning(f"Unable to write Steam DB cache {cache_path}: {e}")
+    return db_data
+
+
 # Locally installed mod metadata
 
 
@@ -84,6 +125,9 @@ class MetadataManager(QObject):
             self.mod_metadata_file_mapper: dict[str, str] = {}
             self.mod_metadata_dir_mapper: dict[str, str] = {}
             self.packageid_to_uuids: dict[str, set[str]] = {}
+            self.uuid_to_packageid: dict[str, str] = {}
+            # Steam mods (workshop or SteamCMD) that have a publishedfileid
+            self.workshop_uuid_set: set[str] = set()
             self.steamdb_packageid_to_name: dict[str, str] = {}
             # Empty game version string unless the data is populated
             self.game_version: str = ""
@@ -149,49 +193,47 @@ class MetadataManager(QObject):
                 logger.info(
                     "Steam DB exists!",
                 )
-                with open(path, encoding="utf-8") as f:
-                    json_string = f.read()
-                    logger.info("Checking metadata expiry against database...")
-                    db_data = json.loads(json_string)
-                    current_time = int(time())
-                    db_time = int(db_data["version"])
-                    elapsed = current_time - db_time
-                    if (
-                        elapsed <= life
-                    ):  # If the duration elapsed since db creation is less than expiry than expiry
-                        # The data is valid
-                        db_json_data = db_data[
-                            "database"
-                        ]  # TODO: additional check to verify integrity of this data's schema
-                        logger.info(
-                            "Cached Steam DB is valid! Returning data to RimSort..."
-                        )
-                        total_entries = len(db_json_data)
-                        logger.info(
-                            f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
-                        )
-                    else:  # If the cached db data is expired but NOT missing
-                        # Fallback to the expired metadata
-                        self.show_warning_signal.emit(
-                            "Steam DB metadata expired",
-                            "Steam DB is expired! Consider updating!\n",
-                            f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_data["version"] - life))}\n\n'
-                            + "Falling back to cached, but EXPIRED Steam Database...",
-                            "",
-                        )
-                        db_json_data = db_data[
-                            "database"
-                        ]  # TODO: additional check to verify integrity of this data's schema
-                        total_entries = len(db_json_data)
-                        logger.info(
-                            f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
-                        )
-                    self.steamdb_packageid_to_name = {
-                        metadata["packageid"]: metadata["name"]
-                        for metadata in db_data.get("database", {}).values()
-                        if metadata.get("packageid") and metadata.get("name")
-                    }
-                    return db_json_data, path
+                db_data = load_steam_db(path)
+                logger.info("Checking metadata expiry against database...")
+                current_time = int(time())
+                db_time = int(db_data["version"])
+                elapsed = current_time - db_time
+                if (
+                    elapsed <= life
+                ):  # If the duration elapsed since db creation is less than expiry than expiry
+                    # The data is valid
+                    db_json_data = db_data[
+                        "database"
+                    ]  # TODO: additional check to verify integrity of this data's schema
+                    logger.info(
+                        "Cached Steam DB is valid! Returning data to RimSort..."
+                    )
+                    total_entries = len(db_json_data)
+                    logger.info(
+                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                    )
+                else:  # If the cached db data is expired but NOT missing
+                    # Fallback to the expired metadata
+                    self.show_warning_signal.emit(
+                        "Steam DB metadata expired",
+                        "Steam DB is expired! Consider updating!\n",
+                        f'Steam DB last updated: {strftime("%Y-%m-%d %H:%M:%S", localtime(db_data["version"] - life))}\n\n'
+                        + "Falling back to cached, but EXPIRED Steam Database...",
+                        "",
+                    )
+                    db_json_data = db_data[
+                        "database"
+                    ]  # TODO: additional check to verify integrity of this data's schema
+                    total_entries = len(db_json_data)
+                    logger.info(
+                        f"Loaded metadata for {total_entries} Steam Workshop mods from Steam DB"
+                    )
+                self.steamdb_packageid_to_name = {
+                    metadata["packageid"]: metadata["name"]
+                    for metadata in db_data.get("database", {}).values()
+                    if metadata.get("packageid") and metadata.get("name")
+                }
+                return db_json_data, path
 
             else:  # Assume db_data_missing
                 self.show_warning_signal.emit(
@@ -390,6 +432,8 @@ class MetadataManager(QObject):
                         "packageid"
                     )
                     self.internal_local_metadata.pop(uuid)
+                    self.uuid_to_packageid.pop(uuid, None)
+                    self.workshop_uuid_set.discard(uuid)
                     if deleted_mod_packageid and self.packageid_to_uuids.get(
                         deleted_mod_packageid
                     ):
@@ -1154,6 +1198,8 @@ class MetadataManager(QObject):
         )
         deleted_mod_packageid = self.internal_local_metadata[uuid].get("packageid")
         self.internal_local_metadata.pop(uuid, None)
+        self.uuid_to_packageid.pop(uuid, None)
+        self.workshop_uuid_set.discard(uuid)
         if deleted_mod_packageid and self.packageid_to_uuids.get(deleted_mod_packageid):
             self.packageid_to_uuids[deleted_mod_packageid].remove(uuid)
         self.mod_deleted_signal.emit(uuid)
@@ -1643,12 +1689,21 @@ class ModParser(QRunnable):
             mod_metadata = self.__parse_mod_metadata(
                 self.data_source, self.mod_directory, self.metadata_manager, self.uuid
             )
-            packageid = mod_metadata[self.uuid].get("packageid")
+            metadata = mod_metadata[self.uuid]
+            packageid = metadata.get("packageid")
             self.metadata_manager.internal_local_metadata.update(mod_metadata)
             # Track packageid -> uuid relationships for future uses
             self.metadata_manager.packageid_to_uuids.setdefault(packageid, set()).add(
                 self.uuid
             )
+            if packageid:
+                self.metadata_manager.uuid_to_packageid[self.uuid] = packageid
+            if (
+                metadata.get("steamcmd") or metadata.get("data_source") == "workshop"
+            ) and metadata.get("publishedfileid"):
+                self.metadata_manager.workshop_uuid_set.add(self.uuid)
+            else:
+                self.metadata_manager.workshop_uuid_set.discard(self.uuid)
         except Exception as e:
             error_message = f"{type(e).__name__}: {str(e)}\n{traceback.format_exc()}"
             logger.error(f"ERROR: Unable to initialize ModParser {error_message}")
@@ -1886,8 +1941,13 @@ def get_mods_from_list(
             json_to_xml_write(generated_xml, mod_list)
         # Parse the ModsConfig.xml activeMods list
         logger.info(f"Retrieving active mods from RimWorld mod list: {mod_list}")
-        mod_data = xml_path_to_json(mod_list)
-        package_ids_to_import = validate_rimworld_mods_list(mod_data)
+        streamed_package_ids = xml_path_to_mods_list(mod_list)
+        if streamed_package_ids is not None:
+            package_ids_to_import = streamed_package_ids
+        else:
+            # Fall back to the full (and more lenient) parser
+            mod_data = xml_path_to_json(mod_list)
+            package_ids_to_import = validate_rimworld_mods_list(mod_data)
     elif isinstance(mod_list, list):
         logger.info("Retrieving active mods from the provided list of package ids")
         package_ids_to_import = mod_list
@@ -2402,7 +2462,9 @@ def import_steamcmd_acf_data(
     dict_to_acf(data=steamcmd_appworkshop_acf, path=steamcmd_appworkshop_acf_path)
 
 
-def query_workshop_update_data(mods: dict[str, Any]) -> str | None:
+def query_workshop_update_data(
+    mods: dict[str, Any], session: Optional[Session] = None
+) -> str | None:
     """
     Query Steam WebAPI for update data, for any workshop mods that have a 'publishedfileid'
     attribute contained in their mod_data, and from there, populate mod_json_data with it.
@@ -2411,6 +2473,7 @@ def query_workshop_update_data(mods: dict[str, Any]) -> str | None:
 
     :param mods: A dict equivalent to 'all_mods' or mod_list.get_list_items_by_dict() in
     which contains possible Steam mods to lookup metadata for
+    :param session: optional requests session to reuse pooled connections
     """
     logger.info("Querying Steam WebAPI for SteamCMD/Steam mod update metadata")
 
@@ -2422,7 +2485,7 @@ def query_workshop_update_data(mods: dict[str, Any]) -> str | None:
     }
 
     workshop_mods_query_updates = ISteamRemoteStorage_GetPublishedFileDetails(
-        list(workshop_mods_pfid_to_uuid.keys())
+        list(workshop_mods_pfid_to_uuid.keys()), session=session
     )
     if workshop_mods_query_updates and len(workshop_mods_query_updates) > 0:
         for workshop_mod_metadata in workshop_mods_query_updates:
@@ -2448,13 +2511,17 @@ def recursively_update_dict(
     purge_keys: Iterable[str] = [],
     recurse_exceptions: Iterable[str] = [],
 ) -> None:
-    # Check for keys in recurse_exceptions in a_dict that are not in b_dict and remove them
-    for key in set(a_dict.keys()) - set(b_dict.keys()):
-        if recurse_exceptions and key in recurse_exceptions:
+    # Hashable once here so every nested level gets O(1) membership checks
+    if not isinstance(recurse_exceptions, frozenset):
+        recurse_exceptions = frozenset(recurse_exceptions)
+    # Check for keys in recurse_exceptions in a_dict that are not in b_dict and remove them.
+    # Walk the few exception keys rather than building key sets of A and B at every level.
+    for key in recurse_exceptions:
+        if key in a_dict and key not in b_dict:
             del a_dict[key]
     # Recursively update A with B, excluding recurse exceptions (list of keys to just overwrite)
     for key, value in b_dict.items():
-        if recurse_exceptions and key in recurse_exceptions:
+        if key in recurse_exceptions:
             # If the key is an exception, update its value directly from B
             a_dict[key] = value
         elif (
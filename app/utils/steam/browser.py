@@ -319,7 +319,7 @@ class SteamBrowser(QWidget):
         self.steamworks_subscription_signal.emit(
             [
                 "订阅",
-                [eval(str_pfid) for str_pfid in self.downloader_list_mods_tracking],
+                [int(str_pfid) for str_pfid in self.downloader_list_mods_tracking],
             ]
         )
 
@@ -18,6 +18,25 @@ from steamworks import STEAMWORKS  # type: ignore
 
 from app.utils.generic import launch_game_process
 
+# SteamworksPy instance loaded ahead of time by a pool worker, as (_libs, instance)
+_preloaded_steamworks: tuple[str | None, STEAMWORKS] | None = None
+
+
+def preload_steamworks(_libs: str | None = None) -> None:
+    """
+    Pool initializer that loads the SteamworksPy library before the first task
+
+    Only the library is loaded here. The Steamworks API itself is still initialized
+    and unloaded by each SteamworksInterface, which takes over this instance.
+
+    :param _libs: optional path to the folder containing the Steamworks libraries
+    """
+    global _preloaded_steamworks
+    try:
+        _preloaded_steamworks = (_libs, STEAMWORKS(_libs=_libs))
+    except Exception as e:
+        logger.warning(f"Unable to preload SteamworksPy: {e.__class__.__name__}")
+
 
 class SteamworksInterface:
     """
@@ -55,7 +74,13 @@ class SteamworksInterface:
         # Used for GetAppDependencies data
         self.get_app_deps_query_result: dict[int, Any] = {}
         self.steam_not_running = False  # Skip action if True. Log occurrences.
-        self.steamworks = STEAMWORKS(_libs=_libs)
+        global _preloaded_steamworks
+        if _preloaded_steamworks is not None and _preloaded_steamworks[0] == _libs:
+            # Take over the library this worker loaded in advance (once only)
+            self.steamworks = _preloaded_steamworks[1]
+            _preloaded_steamworks = None
+        else:
+            self.steamworks = STEAMWORKS(_libs=_libs)
         try:
             self.steamworks.initialize()  # Init the Steamworks API
         except Exception as e:
@@ -292,8 +317,9 @@ class SteamworksSubscriptionHandler:
             while not steamworks_interface.steamworks.loaded():  # Ensure that Steamworks API is initialized before attempting any instruction
                 break
             else:
+                last_index = len(self.pfid_or_pfids) - 1
                 if self.action == "resubscribe":
-                    for pfid in self.pfid_or_pfids:
+                    for i, pfid in enumerate(self.pfid_or_pfids):
                         logger.debug(
                             f"ISteamUGC/UnsubscribeItem + SubscribeItem Action : {pfid}"
                         )
@@ -308,11 +334,11 @@ class SteamworksSubscriptionHandler:
                         steamworks_interface.steamworks.Workshop.UnsubscribeItem(pfid)
                         sleep(self.interval)
                         steamworks_interface.steamworks.Workshop.SubscribeItem(pfid)
-                        # Sleep for the interval if we have more than one pfid to action on
-                        if len(self.pfid_or_pfids) > 1:
+                        # Sleep for the interval between pfids, but not after the last one
+                        if i < last_index:
                             sleep(self.interval)
                 elif self.action == "subscribe":
-                    for pfid in self.pfid_or_pfids:
+                    for i, pfid in enumerate(self.pfid_or_pfids):
                         logger.debug(f"ISteamUGC/SubscribeItem Action : {pfid}")
                         # Point Steamworks API callback response to our functions
                         steamworks_interface.steamworks.Workshop.SetItemSubscribedCallback(
@@ -320,11 +346,11 @@ class SteamworksSubscriptionHandler:
                         )
                         # Create API calls
                         steamworks_interface.steamworks.Workshop.SubscribeItem(pfid)
-                        # Sleep for the interval if we have more than one pfid to action on
-                        if len(self.pfid_or_pfids) > 1:
+                        # Sleep for the interval between pfids, but not after the last one
+                        if i < last_index:
                             sleep(self.interval)
                 elif self.action == "unsubscribe":
-                    for pfid in self.pfid_or_pfids:
+                    for i, pfid in enumerate(self.pfid_or_pfids):
                         logger.debug(f"ISteamUGC/UnsubscribeItem Action : {pfid}")
                         # Point Steamworks API callback response to our functions
                         steamworks_interface.steamworks.Workshop.SetItemUnsubscribedCallback(
@@ -332,8 +358,8 @@ class SteamworksSubscriptionHandler:
                         )
                         # Create API calls
                         steamworks_interface.steamworks.Workshop.UnsubscribeItem(pfid)
-                        # Sleep for the interval if we have more than one pfid to action on
-                        if len(self.pfid_or_pfids) > 1:
+                        # Sleep for the interval between pfids, but not after the last one
+                        if i < last_index:
                             sleep(self.interval)
                 # Patience, but don't wait forever
                 steamworks_interface._wait_for_callbacks(timeout=10)
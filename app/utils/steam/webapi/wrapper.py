@@ -1,5 +1,6 @@
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from logging import WARNING, getLogger
 from math import ceil
 from multiprocessing import Pool, cpu_count
@@ -8,6 +9,7 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from loguru import logger
 from PySide6.QtCore import QObject, Signal
+from requests import Session
 from requests import post as requests_post
 from requests.exceptions import JSONDecodeError
 from steam.webapi import WebAPI
@@ -33,20 +35,30 @@ BASE_URL = "https://steamcommunity.com"
 BASE_URL_STEAMFILES = "https://steamcommunity.com/sharedfiles/filedetails/?id="
 BASE_URL_WORKSHOP = "https://steamcommunity.com/workshop/filedetails/?id="
 
+# GetPublishedFileDetails batches are small enough to be fetched in parallel
+PUBLISHEDFILEDETAILS_BATCH_SIZE = 100
+PUBLISHEDFILEDETAILS_MAX_WORKERS = 8
+
 
 class CollectionImport:
     """
     Class to handle importing workshop collection links and extracting package IDs.
     """
 
-    def __init__(self, metadata_manager: "MetadataManager") -> None:
+    def __init__(
+        self,
+        metadata_manager: "MetadataManager",
+        session: Optional[Session] = None,
+    ) -> None:
         """
         Initialize the CollectionImport instance.
 
         Args:
             metadata_manager: The metadata manager instance.
+            session: Optional requests session to reuse pooled connections.
         """
         self.metadata_manager = metadata_manager
+        self.session = session
         self.package_ids: list[
             str
         ] = []  # Initialize an empty list to store package IDs
@@ -116,7 +128,7 @@ class CollectionImport:
             elif BASE_URL_WORKSHOP in collection_link:
                 collection_link = collection_link.split(BASE_URL_WORKSHOP, 1)[1]
             collection_webapi_result = ISteamRemoteStorage_GetCollectionDetails(
-                [collection_link]
+                [collection_link], session=self.session
             )
             if (
                 collection_webapi_result is not None
@@ -599,7 +611,7 @@ class DynamicQuery(QObject):
             # Create instances of SteamworksAppDependenciesQuery for each chunk
             queries = [
                 SteamworksAppDependenciesQuery(
-                    pfid_or_pfids=[eval(str_pfid) for str_pfid in chunk],
+                    pfid_or_pfids=[int(str_pfid) for str_pfid in chunk],
                     interval=1,
                     _libs=str((AppInfo().application_folder / "libs")),
                 )
@@ -641,6 +653,7 @@ class DynamicQuery(QObject):
 
 def ISteamRemoteStorage_GetCollectionDetails(
     publishedfileids: list[str],
+    session: Optional[Session] = None,
 ) -> list[Any] | None:
     """
     Given a list of Steam Workshopmod collection PublishedFileIds, return a dict of
@@ -649,8 +662,10 @@ def ISteamRemoteStorage_GetCollectionDetails(
     https://steamapi.xpaw.me/#ISteamRemoteStorage/GetCollectionDetails
 
     :param publishedfileids: a list of 1 or more publishedfileids to lookup metadata for
+    :param session: optional requests session to reuse pooled connections
     :return: a JSON object that is the response from your WebAPI query
     """
+    post = session.post if session is not None else requests_post
     # Construct the URL to retrieve information about the collection
     url = "https://api.steampowered.com/ISteamRemoteStorage/GetCollectionDetails/v1/"
     # Construct arguments to pass to the API call
@@ -665,7 +680,7 @@ def ISteamRemoteStorage_GetCollectionDetails(
             count = chunk.index(publishedfileid)
             data[f"publishedfileids[{count}]"] = publishedfileid
         try:  # Make a request to the Steam Web API
-            request = requests_post(url, data=data)
+            request = post(url, data=data)
         except Exception as e:
             logger.warning(
                 f"无法完成请求！您是否已连接到互联网？收到异常: {e.__class__.__name__}"
@@ -687,6 +702,7 @@ def ISteamRemoteStorage_GetCollectionDetails(
 
 def ISteamRemoteStorage_GetPublishedFileDetails(
     publishedfileids: list[str],
+    session: Optional[Session] = None,
 ) -> list[Any] | None:
     """
     Given a list of PublishedFileIds, return a dict of json data queried
@@ -695,35 +711,55 @@ def ISteamRemoteStorage_GetPublishedFileDetails(
     https://steamapi.xpaw.me/#ISteamRemoteStorage/GetPublishedFileDetails
 
     :param publishedfileids: a list of 1 or more publishedfileids to lookup metadata for
+    :param session: optional requests session to reuse pooled connections
     :return: a JSON object that is the response from your WebAPI query
     """
+    post = session.post if session is not None else requests_post
     # Construct the URL to retrieve information about the mod
     url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
-    metadata = []
-    # Construct arguments to pass to the API call
-    for chunk in list(chunks(_list=publishedfileids, limit=5000)):
+
+    def _fetch_batch(chunk: list[str]) -> list[Any] | None:
         logger.debug(f"Querying details for {len(chunk)} mod(s) via Steam WebAPI")
         # Construct arguments to pass to the API call
         data = {"itemcount": f"{str(len(chunk))}"}
-        for publishedfileid in chunk:
-            count = chunk.index(publishedfileid)
+        for count, publishedfileid in enumerate(chunk):
             data[f"publishedfileids[{count}]"] = publishedfileid
         try:  # Make a request to the Steam Web API
-            request = requests_post(url, data=data)
+            request = post(url, data=data)
         except Exception as e:
             logger.debug(
                 f"无法完成请求！您是否已连接到互联网？收到异常: {e.__class__.__name__}"
             )
             return None
+        batch_metadata = []
         try:  # Parse the JSON response
             json_response = request.json()
             if json_response.get("response", {}).get("resultcount") > 0:
                 for mod_metadata in json_response["response"]["publishedfiledetails"]:
-                    metadata.append(mod_metadata)
+                    batch_metadata.append(mod_metadata)
         except JSONDecodeError as e:
             logger.error(f"无效的 JSON 响应: {e}")
         finally:
             logger.debug(f"从查询中接收 WebAPI 响应 {request.status_code} ")
+        return batch_metadata
+
+    batches = list(
+        chunks(_list=publishedfileids, limit=PUBLISHEDFILEDETAILS_BATCH_SIZE)
+    )
+    if len(batches) <= 1:
+        # Nothing to overlap, so skip the thread pool
+        results = [_fetch_batch(batch) for batch in batches]
+    else:
+        # Fetch batches concurrently; results are collected in submission order
+        with ThreadPoolExecutor(
+            max_workers=min(PUBLISHEDFILEDETAILS_MAX_WORKERS, len(batches))
+        ) as executor:
+            results = list(executor.map(_fetch_batch, batches))
+    metadata = []
+    for batch_metadata in results:
+        if batch_metadata is None:
+            return None
+        metadata.extend(batch_metadata)
 
     return metadata
 
@@ -4,6 +4,15 @@ from typing import Any
 import xmltodict
 from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
+
+# Container tag -> allowed root tags locating package ids in RimWorld mod lists:
+# ModsConfig.xml -> ModsConfigData/activeMods/li
+# .rws savegame / .rml modlist -> {savegame,savedModList}/meta/modIds/li
+_MODS_LIST_CONTAINERS = {
+    "activeMods": ("ModsConfigData",),
+    "modIds": ("savegame", "savedModList"),
+}
 
 
 def xml_path_to_json(path: str) -> dict[str, Any]:
@@ -45,22 +54,81 @@ def xml_path_to_json(path: str) -> dict[str, Any]:
         return data
 
 
-def json_to_xml_write(data: dict[str, Any], path: str) -> None:
+def _is_mods_list_entry(elem: etree._Element) -> bool:
+    """
+    Check whether an <li> element belongs to one of the known mods list containers.
+
+    :param elem: <li> element to check.
+    :return: True if the element holds an active mod package id.
+    """
+    container = elem.getparent()
+    if container is None or container.tag not in _MODS_LIST_CONTAINERS:
+        return False
+    root = container.getparent()
+    if container.tag == "modIds":
+        if root is None or root.tag != "meta":
+            return False
+        root = root.getparent()
+    return (
+        root is not None
+        and root.getparent() is None
+        and root.tag in _MODS_LIST_CONTAINERS[container.tag]
+    )
+
+
+def xml_path_to_mods_list(path: str) -> list[str] | None:
+    """
+    Stream the package ids out of a RimWorld mods list (ModsConfig.xml, .rws
+    or .rml) without building the whole document in memory. Parsing stops as
+    soon as the list of package ids has been read.
+
+    :param path: Path to the XML file.
+    :return: list of package ids, or None if the file could not be parsed
+    or contains no recognised mods list.
+    """
+    package_ids: list[str] = []
+    try:
+        for _, elem in etree.iterparse(path, events=("end",), huge_tree=True):
+            if elem.tag == "li" and _is_mods_list_entry(elem) and elem.text:
+                package_id = elem.text.strip()
+                if package_id:
+                    package_ids.append(package_id)
+            elif elem.tag in _MODS_LIST_CONTAINERS and package_ids:
+                break
+            # Free elements we have already processed
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    except Exception as e:
+        logger.debug(f"Error streaming mods list from XML file {path}: {e}")
+        return None
+    return package_ids or None
+
+
+def json_to_xml_write(data: dict[str, Any], path: str) -> bool:
     """
     Write JSON data to an XML file.
+    The file is written next to the target and then swapped into place,
+    so an interrupted write never leaves a truncated file behind.
 
     :param data: JSON data to write.
     :param path: Path to write the XML file to.
+    :return: True if the file was written, False otherwise.
     """
     logger.debug("Started writing JSON to XML")
+    tmp_path = path + ".tmp"
     try:
         # Convert JSON data to XML format using xmltodict
         xml_data = xmltodict.unparse(data, pretty=True)
-        # Write the XML data to the specified file path
-        with open(path, "w", encoding="utf-8") as file:
+        # Write the XML data to a temporary file, then replace the target with it
+        with open(tmp_path, "w", encoding="utf-8") as file:
             file.write(xml_data)
+        os.replace(tmp_path, path)
     except Exception as e:
         logger.error(f"Error writing XML file: {e}")
-        return
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
 
     logger.debug("Finished writing JSON to XML")
+    return True
@@ -1,51 +1,38 @@
+import atexit
 import datetime
-import json
+import gc
+import mmap
 import os
-import platform
-import subprocess
-import sys
+import re
+import shutil
 import time
 import traceback
 import webbrowser
-from functools import partial
-from gc import collect
-from io import BytesIO
-from math import ceil
-from multiprocessing import Pool, cpu_count
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache, partial
 from pathlib import Path
 from tempfile import gettempdir
-from typing import Any, Callable, Self
+from typing import TYPE_CHECKING, Any, Callable, Self
 from urllib.parse import urlparse
-from zipfile import ZipFile
 
+import msgspec
 from loguru import logger
-
-from app.utils.generic import platform_specific_open
-from app.utils.system_info import SystemInfo
-
-# GitPython depends on git executable being available in PATH
-try:
-    from git import Repo
-    from git.exc import GitCommandError
-
-    GIT_EXISTS = True
-except ImportError:
-    logger.warning(
-        "git not detected in your PATH! Do you have git installed...? git integration will be disabled! You may need to restart the app if you installed it."
-    )
-    GIT_EXISTS = False
-
-from github import Github
 from PySide6.QtCore import (
     QEventLoop,
     QObject,
     QProcess,
+    QRunnable,
     Qt,
+    QThreadPool,
+    QTimer,
     Signal,
     Slot,
 )
 from PySide6.QtWidgets import QFrame, QHBoxLayout, QLabel
-from requests import get as requests_get
+from requests import HTTPError, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import app.utils.constants as app_constants
 import app.utils.metadata as metadata
@@ -55,34 +42,308 @@ from app.models.animations import LoadingAnimation
 from app.utils.app_info import AppInfo
 from app.utils.event_bus import EventBus
 from app.utils.generic import (
-    chunks,
     copy_to_clipboard_safely,
     delete_files_except_extension,
+    even_chunks,
     launch_game_process,
     open_url_browser,
+    platform_specific_open,
     upload_data_to_0x0_st,
 )
-from app.utils.metadata import MetadataManager, SettingsController
+from app.utils.metadata import SettingsController
 from app.utils.rentry.wrapper import RentryImport, RentryUpload
 from app.utils.schema import generate_rimworld_mods_list
-from app.utils.steam.browser import SteamBrowser
 from app.utils.steam.steamcmd.wrapper import SteamcmdInterface
 from app.utils.steam.steamworks.wrapper import (
     SteamworksGameLaunch,
     SteamworksSubscriptionHandler,
+    preload_steamworks,
 )
 from app.utils.steam.webapi.wrapper import (
     CollectionImport,
     ISteamRemoteStorage_GetPublishedFileDetails,
 )
-from app.utils.todds.wrapper import ToddsInterface
+from app.utils.system_info import SystemInfo
 from app.utils.xml import json_to_xml_write
 from app.views.mod_info_panel import ModInfo
 from app.views.mods_panel import ModListWidget, ModsPanel, ModsPanelSortKey
-from app.windows.missing_mods_panel import MissingModsPrompt
+from app.windows.missing_mods_panel import (
+    MissingModsPrompt,
+    build_missing_mods_variants,
+)
 from app.windows.rule_editor_panel import RuleEditor
 from app.windows.runner_panel import RunnerPanel
-from app.windows.workshop_mod_updater_panel import ModUpdaterPrompt
+
+if TYPE_CHECKING:
+    from multiprocessing.pool import Pool
+
+    from git import Repo
+    from github import Github
+    from github.Repository import Repository
+
+    from app.utils.steam.browser import SteamBrowser
+
+# GitPython depends on git executable being available in PATH
+GIT_EXISTS = shutil.which("git") is not None
+if not GIT_EXISTS:
+    logger.warning(
+        "git not detected in your PATH! Do you have git installed...? git integration will be disabled! You may need to restart the app if you installed it."
+    )
+
+# Shared HTTP session so repeated GitHub/Steam requests reuse pooled connections
+_HTTP_SESSION = Session()
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+_HTTP_SESSION.mount("https://", _HTTP_ADAPTER)
+_HTTP_SESSION.mount("http://", _HTTP_ADAPTER)
+
+# Dedicated GitHub session: shared headers, keep-alive across the update flow, and
+# transparent retries for transient 5xx (rate limits are handled by _gh_get)
+_GH_SESSION = Session()
+_GH_SESSION.headers.update(
+    {
+        "User-Agent": f"RimSort/{AppInfo().app_version}",
+        "Accept": "application/vnd.github+json",
+    }
+)
+_GH_ADAPTER = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+)
+_GH_SESSION.mount("https://", _GH_ADAPTER)
+
+# EventBus is a singleton, so resolve it once for the whole module
+_BUS = EventBus()
+
+
+# Longest total time _gh_get sleeps on rate limits before giving up
+_GH_MAX_RATE_LIMIT_WAIT = 10
+
+
+class _GitHubRateLimited(HTTPError):
+    """Raised by _gh_get when GitHub's rate limit outlasts the retry budget."""
+
+
+def _gh_get(
+    url: str,
+    headers: dict[str, str] | None = None,
+    max_retries: int = 3,
+    **kwargs: Any,
+) -> Response:
+    """
+    GET a GitHub URL, backing off briefly when rate limited (HTTP 403/429).
+
+    Honors Retry-After and X-RateLimit-Reset, otherwise waits 1s, 2s, 4s...
+    Waits at most _GH_MAX_RATE_LIMIT_WAIT seconds in total, then raises
+    _GitHubRateLimited. Raises requests.HTTPError for any other error status.
+
+    :param url: URL to request
+    :param headers: optional request headers
+    :param max_retries: number of retries before giving up
+    :return: the response (including 304 Not Modified)
+    """
+    waited = 0.0
+    for attempt in range(max_retries + 1):
+        response = _GH_SESSION.get(url, headers=headers, **kwargs)
+        retry_after = response.headers.get("Retry-After")
+        rate_limited = response.status_code == 429 or (
+            response.status_code == 403
+            and (
+                retry_after is not None
+                or response.headers.get("X-RateLimit-Remaining") == "0"
+            )
+        )
+        if not rate_limited:
+            break
+        reset = response.headers.get("X-RateLimit-Reset")
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        elif reset is not None and reset.isdigit():
+            delay = int(reset) - time.time()
+        else:
+            delay = 0
+        delay = max(delay, 2**attempt)
+        if attempt == max_retries or waited + delay > _GH_MAX_RATE_LIMIT_WAIT:
+            response.close()
+            raise _GitHubRateLimited(
+                f"GitHub API rate limit reached (HTTP {response.status_code}). "
+                + f"Try again in {delay:.0f}s.",
+                response=response,
+            )
+        logger.warning(
+            f"GitHub rate limit hit (HTTP {response.status_code}), retrying in {delay:.0f}s"
+        )
+        response.close()
+        time.sleep(delay)
+        waited += delay
+    response.raise_for_status()
+    return response
+
+
+# Release archive names keyed by (system, processor); None matches any processor
+_ARCHIVE_FMTS: dict[tuple[str, str | None], str] = {
+    ("Darwin", "i386"): "RimSort-{tag}_Darwin_i386.zip",
+    ("Darwin", "arm"): "RimSort-{tag}_Darwin_arm.zip",
+    ("Linux", None): "RimSort-{tag}_Linux_{proc}.zip",
+    ("Windows", None): "RimSort-{tag}_Windows.zip",
+}
+
+
+# How long a cached Steam Workshop preview url is reused before re-querying
+_PREVIEW_URL_CACHE_TTL = 7 * 24 * 60 * 60
+
+
+# A configured repository must be a non-empty http(s) URL
+_REPO_URL_RE = re.compile(r"https?://\S+")
+
+
+def _split_repo_url(repo_url: str) -> tuple[str, str]:
+    """
+    Split a repository URL into its owner and repository name
+
+    :param repo_url: URL such as https://github.com/<user_or_org>/<repo>
+    :return: tuple of (user_or_org, repo_folder_name)
+    """
+    parts = urlparse(repo_url).path.rstrip("/").rsplit("/", 2)
+    return (parts[-2] if len(parts) > 1 else ""), parts[-1]
+
+
+# Minimum seconds between two fetches of the same git repo in one session
+_GIT_FETCH_MIN_INTERVAL = 60
+
+# Upper bound on Steamworks worker processes. Most subscription calls only need
+# one or two, and every idle worker holds its own copy of SteamworksPy.
+_STEAMWORKS_POOL_SIZE = min(4, os.cpu_count() or 1)
+
+
+# Rentry report lines for Steam mods (with preview image) and local mods
+_RENTRY_STEAM_TPL = "\n{count}. ![]({preview_url}) {name} packageid: {package_id}"
+_RENTRY_STEAM_URL_TPL = (
+    "\n{count}. ![]({preview_url}) [{name}]({url} packageid: {package_id})"
+)
+_RENTRY_LOCAL_TPL = "\n!!! warning {count}. {name} {{packageid: {package_id}}} "
+_RENTRY_LOCAL_URL_TPL = (
+    "\n!!! warning {count}. [{name}]({url}) {{packageid: {package_id}}} "
+)
+
+
+def _json_loads(data: bytes | memoryview | str) -> Any:
+    """
+    Decode JSON using msgspec, which is considerably faster than the stdlib
+
+    :param data: JSON document as bytes, a bytes-like view or str
+    :return: the decoded Python object
+    """
+    return msgspec.json.decode(data)
+
+
+class _DatabaseStamp(msgspec.Struct):
+    """
+    Top-level version fields of a Steam or community rules database
+
+    Decoding into this skips every other key without building Python objects.
+    """
+
+    version: int | float | None = None
+    timestamp: int | float | None = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Encode an object as indented JSON bytes using msgspec
+
+    :param obj: object to encode
+    :return: UTF-8 encoded JSON document
+    """
+    return msgspec.json.format(msgspec.json.encode(obj), indent=4)
+
+
+def _load_json(path: str | Path) -> Any:
+    """
+    Decode a JSON file straight from a read-only memory map of it
+
+    :param path: path of the JSON file
+    :return: the decoded Python object
+    """
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        memoryview(mm) as view,
+    ):
+        return _json_loads(view)
+
+
+def _load_json_files(paths: list[str]) -> list[Any]:
+    """
+    Read and decode several JSON files, in order
+
+    :param paths: paths of the JSON files
+    :return: the decoded Python objects
+    """
+    with ExitStack() as stack:
+        views = []
+        for path in paths:
+            f = stack.enter_context(open(path, "rb"))
+            mm = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            if hasattr(mmap, "MADV_WILLNEED"):
+                # Have the kernel read every file ahead while the first is decoded
+                mm.madvise(mmap.MADV_WILLNEED)
+            views.append(stack.enter_context(memoryview(mm)))
+        databases = []
+        for path, view in zip(paths, views):
+            logger.debug(f"Reading info from {path}...")
+            databases.append(_json_loads(view))
+    logger.debug(f"Retrieved {len(databases)} database(s)")
+    return databases
+
+
+def _dump_json(path: str | Path, obj: Any) -> bool:
+    """
+    Encode an object as indented JSON and write it with a single write call
+
+    The bytes go to a temporary file that then replaces the target, so a crash
+    mid-write never leaves a truncated database behind.
+
+    :param path: path of the JSON file to write
+    :param obj: object to encode
+    :return: True once the file is written, so threaded callers can tell success
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        Path(tmp_path).write_bytes(_json_dumps(obj))
+        os.replace(tmp_path, path)
+    except Exception:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return True
+
+
+@lru_cache(maxsize=1)
+def _load_git() -> tuple[type["Repo"], type[Exception]]:
+    """
+    Import GitPython on first use instead of at startup
+
+    :return: tuple of the Repo class and GitCommandError exception type
+    """
+    from git import Repo
+    from git.exc import GitCommandError
+
+    return Repo, GitCommandError
+
+
+def _github() -> type["Github"]:
+    """
+    Import PyGithub on first use instead of at startup
+
+    :return: the Github client class
+    """
+    from github import Github
+
+    return Github
 
 
 class MainContent(QObject):
@@ -99,15 +360,14 @@ class MainContent(QObject):
     disable_enable_widgets_signal = Signal(bool)
     status_signal = Signal(str)
     stop_watchdog_signal = Signal()
+    _missing_mods_variants_signal = Signal(list, dict)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "MainContent":
         if cls._instance is None:
             cls._instance = super(MainContent, cls).__new__(cls)
         return cls._instance
 
-    def __init__(
-        self, settings_controller: SettingsController
-    ) -> None:
+    def __init__(self, settings_controller: SettingsController) -> None:
         """
         Initialize the main content panel.
 
@@ -119,99 +379,88 @@ class MainContent(QObject):
 
             self.settings_controller = settings_controller
 
-            EventBus().settings_have_changed.connect(self._on_settings_have_changed)
-            EventBus().do_check_for_application_update.connect(
-                self._do_check_for_update
-            )
-            EventBus().do_validate_steam_client.connect(self._do_validate_steam_client)
-            EventBus().do_open_mod_list.connect(self._do_import_list_file_xml)
-            EventBus().do_import_mod_list_from_rentry.connect(
-                self._do_import_list_rentry
-            )
-            EventBus().do_import_mod_list_from_workshop_collection.connect(
+            bus = _BUS
+            bus.settings_have_changed.connect(self._on_settings_have_changed)
+            bus.do_check_for_application_update.connect(self._do_check_for_update)
+            bus.do_validate_steam_client.connect(self._do_validate_steam_client)
+            bus.do_open_mod_list.connect(self._do_import_list_file_xml)
+            bus.do_import_mod_list_from_rentry.connect(self._do_import_list_rentry)
+            bus.do_import_mod_list_from_workshop_collection.connect(
                 self._do_import_list_workshop_collection
             )
-            EventBus().do_save_mod_list_as.connect(self._do_export_list_file_xml)
-            EventBus().do_export_mod_list_to_clipboard.connect(
-                self._do_export_list_clipboard
-            )
-            EventBus().do_export_mod_list_to_rentry.connect(self._do_upload_list_rentry)
-            EventBus().do_upload_community_rules_db_to_github.connect(
+            bus.do_save_mod_list_as.connect(self._do_export_list_file_xml)
+            bus.do_export_mod_list_to_clipboard.connect(self._do_export_list_clipboard)
+            bus.do_export_mod_list_to_rentry.connect(self._do_upload_list_rentry)
+            bus.do_upload_community_rules_db_to_github.connect(
                 self._on_do_upload_community_db_to_github
             )
-            EventBus().do_download_community_rules_db_from_github.connect(
+            bus.do_download_community_rules_db_from_github.connect(
                 self._on_do_download_community_db_from_github
             )
-            EventBus().do_upload_steam_workshop_db_to_github.connect(
+            bus.do_upload_steam_workshop_db_to_github.connect(
                 self._on_do_upload_steam_workshop_db_to_github
             )
-            EventBus().do_download_steam_workshop_db_from_github.connect(
+            bus.do_download_steam_workshop_db_from_github.connect(
                 self._on_do_download_steam_workshop_db_from_github
             )
-            EventBus().do_upload_rimsort_log.connect(self._on_do_upload_rimsort_log)
-            EventBus().do_upload_rimsort_old_log.connect(
-                self._on_do_upload_rimsort_old_log
-            )
-            EventBus().do_upload_rimworld_log.connect(self._on_do_upload_rimworld_log)
-            EventBus().do_download_all_mods_via_steamcmd.connect(
+            bus.do_upload_rimsort_log.connect(self._on_do_upload_rimsort_log)
+            bus.do_upload_rimsort_old_log.connect(self._on_do_upload_rimsort_old_log)
+            bus.do_upload_rimworld_log.connect(self._on_do_upload_rimworld_log)
+            bus.do_download_all_mods_via_steamcmd.connect(
                 self._on_do_download_all_mods_via_steamcmd
             )
-            EventBus().do_download_all_mods_via_steam.connect(
+            bus.do_download_all_mods_via_steam.connect(
                 self._on_do_download_all_mods_via_steam
             )
-            EventBus().do_compare_steam_workshop_databases.connect(
+            bus.do_compare_steam_workshop_databases.connect(
                 self._do_generate_metadata_comparison_report
             )
-            EventBus().do_merge_steam_workshop_databases.connect(
-                self._do_merge_databases
-            )
-            EventBus().do_build_steam_workshop_database.connect(
+            bus.do_merge_steam_workshop_databases.connect(self._do_merge_databases)
+            bus.do_build_steam_workshop_database.connect(
                 self._on_do_build_steam_workshop_database
             )
-            EventBus().do_import_acf.connect(
+            bus.do_import_acf.connect(
                 lambda: self.actions_slot("import_steamcmd_acf_data")
             )
-            EventBus().do_delete_acf.connect(
+            bus.do_delete_acf.connect(
                 lambda: self.actions_slot("reset_steamcmd_acf_data")
             )
-            EventBus().do_install_steamcmd.connect(self._do_setup_steamcmd)
+            bus.do_install_steamcmd.connect(self._do_setup_steamcmd)
 
-            EventBus().do_refresh_mods_lists.connect(self._do_refresh)
-            EventBus().do_clear_active_mods_list.connect(self._do_clear)
-            EventBus().do_restore_active_mods_list.connect(self._do_restore)
-            EventBus().do_sort_active_mods_list.connect(self._do_sort)
-            EventBus().do_save_active_mods_list.connect(self._do_save)
-            EventBus().do_run_game.connect(self._do_run_game)
+            bus.do_refresh_mods_lists.connect(self._do_refresh)
+            bus.do_clear_active_mods_list.connect(self._do_clear)
+            bus.do_restore_active_mods_list.connect(self._do_restore)
+            bus.do_sort_active_mods_list.connect(self._do_sort)
+            bus.do_save_active_mods_list.connect(self._do_save)
+            bus.do_run_game.connect(self._do_run_game)
 
             # Shortcuts submenu Eventbus
-            EventBus().do_open_app_directory.connect(self._do_open_app_directory)
-            EventBus().do_open_settings_directory.connect(
-                self._do_open_settings_directory
-            )
-            EventBus().do_open_rimsort_logs_directory.connect(
+            bus.do_open_app_directory.connect(self._do_open_app_directory)
+            bus.do_open_settings_directory.connect(self._do_open_settings_directory)
+            bus.do_open_rimsort_logs_directory.connect(
                 self._do_open_rimsort_logs_directory
             )
-            EventBus().do_open_rimworld_logs_directory.connect(
+            bus.do_open_rimworld_logs_directory.connect(
                 self._do_open_rimworld_logs_directory
             )
 
             # Edit Menu bar Eventbus
-            EventBus().do_rule_editor.connect(
+            bus.do_rule_editor.connect(
                 lambda: self.actions_slot("open_community_rules_with_rule_editor")
             )
 
             # Download Menu bar Eventbus
-            EventBus().do_add_git_mod.connect(self._do_add_git_mod)
-            EventBus().do_browse_workshop.connect(self._do_browse_workshop)
-            EventBus().do_check_for_workshop_updates.connect(
+            bus.do_add_git_mod.connect(self._do_add_git_mod)
+            bus.do_browse_workshop.connect(self._do_browse_workshop)
+            bus.do_check_for_workshop_updates.connect(
                 self._do_check_for_workshop_updates
             )
 
             # Textures Menu bar Eventbus
-            EventBus().do_optimize_textures.connect(
+            bus.do_optimize_textures.connect(
                 lambda: self.actions_slot("optimize_textures")
             )
-            EventBus().do_delete_dds_textures.connect(
+            bus.do_delete_dds_textures.connect(
                 lambda: self.actions_slot("delete_textures")
             )
 
@@ -256,6 +505,9 @@ class MainContent(QObject):
             self.metadata_manager.mod_metadata_updated_signal.connect(
                 self.mods_panel.on_mod_metadata_updated  # Connect MetadataManager to ModPanel for mod metadata updates
             )
+            self.metadata_manager.mod_metadata_updated_signal.connect(
+                self._invalidate_active_mods_snapshot
+            )
             self.mods_panel.active_mods_list.key_press_signal.connect(
                 self.__handle_active_mod_key_press
             )
@@ -280,11 +532,12 @@ class MainContent(QObject):
             self.mods_panel.inactive_mods_list.edit_rules_signal.connect(
                 self._do_open_rule_editor
             )
+            # "Update git mod(s)" is an explicit request, so always fetch
             self.mods_panel.active_mods_list.update_git_mods_signal.connect(
-                self._check_git_repos_for_update
+                partial(self._check_git_repos_for_update, force=True)
             )
             self.mods_panel.inactive_mods_list.update_git_mods_signal.connect(
-                self._check_git_repos_for_update
+                partial(self._check_git_repos_for_update, force=True)
             )
             self.mods_panel.active_mods_list.steamcmd_downloader_signal.connect(
                 self._do_download_mods_with_steamcmd
@@ -311,18 +564,103 @@ class MainContent(QObject):
             self.active_mods_uuids_restore_state: list[str] = []
             self.inactive_mods_uuids_restore_state: list[str] = []
 
-            # Store duplicate_mods for global access
+            # Store duplicate_mods and missing_mods for global access
             self.duplicate_mods: dict[str, Any] = {}
+            self.missing_mods: list[str] = []
 
             # Instantiate query runner
             self.query_runner: RunnerPanel | None = None
 
+            self._missing_mods_variants_signal.connect(
+                self._on_missing_mods_variants_ready
+            )
+
+            # Pending warning recalculation for the mod lists
+            self._warnings_recalc_pending = False
+
+            # Last active mods snapshot, keyed by the active uuids it was built from
+            self._active_mods_snapshot: (
+                tuple[tuple[str, ...], tuple[list[str], dict[str, str], set[str]]]
+                | None
+            ) = None
+
+            # Steam Workshop preview urls for rentry exports, loaded on first use
+            self._preview_url_cache: dict[str, tuple[float, str]] | None = None
+
             # Steamworks bool - use this to check any Steamworks processes you try to initialize
             self.steamworks_in_use = False
+            # Worker pool for Steamworks subscription actions, created on first use
+            self._steamworks_pool: "Pool | None" = None
+
+            # time.monotonic() of the last fetch per git repo path
+            self._repo_last_fetch: dict[str, float] = {}
+
+            # GitHub client keyed on the (username, token) it was built with,
+            # and the repositories already looked up through it
+            self._github_client: tuple[tuple[str, str], "Github"] | None = None
+            self._github_repo_cache: dict[str, "Repository"] = {}
 
             # Instantiate todds runner
             self.todds_runner: RunnerPanel | None = None
 
+            # Map action strings received by actions_slot to their handlers
+            self._actions: dict[str, Callable[[], Any]] = {
+                # game configuration panel actions
+                "check_for_update": self._do_check_for_update,
+                # actions panel actions
+                "refresh": self._do_refresh,
+                "clear": self._do_clear,
+                "restore": self._do_restore,
+                "sort": self._do_sort,
+                "optimize_textures": partial(
+                    self._do_todds_action, "optimize_textures"
+                ),
+                "delete_textures": partial(self._do_todds_action, "delete_textures"),
+                "add_git_mod": self._do_add_git_mod,
+                "browse_workshop": self._do_browse_workshop,
+                "import_steamcmd_acf_data": self._do_import_steamcmd_acf_data,
+                "reset_steamcmd_acf_data": self._do_reset_steamcmd_acf_data,
+                "update_workshop_mods": self._do_check_for_workshop_updates,
+                "import_list_file_xml": self._do_import_list_file_xml,
+                "import_list_rentry": self._do_import_list_rentry,
+                "export_list_file_xml": self._do_export_list_file_xml,
+                "export_list_clipboard": self._do_export_list_clipboard,
+                "upload_list_rentry": self._do_upload_list_rentry,
+                "save": self._do_save,
+                # settings panel actions
+                "configure_github_identity": self._do_configure_github_identity,
+                "configure_steam_database_path": self._do_configure_steam_db_file_path,
+                "configure_steam_database_repo": self._do_configure_steam_database_repo,
+                "download_steam_database": partial(
+                    self._do_download_database, "external_steam_metadata_repo"
+                ),
+                "upload_steam_database": partial(
+                    self._do_upload_database,
+                    "external_steam_metadata_repo",
+                    "steamDB.json",
+                ),
+                "configure_community_rules_db_path": self._do_configure_community_rules_db_file_path,
+                "configure_community_rules_db_repo": self._do_configure_community_rules_db_repo,
+                "download_community_rules_database": partial(
+                    self._do_download_database, "external_community_rules_repo"
+                ),
+                "open_community_rules_with_rule_editor": partial(
+                    self._do_open_rule_editor,
+                    compact=False,
+                    initial_mode="community_rules",
+                ),
+                "upload_community_rules_database": partial(
+                    self._do_upload_database,
+                    "external_community_rules_repo",
+                    "communityRules.json",
+                ),
+                "build_steam_database_thread": self._do_build_database_thread,
+                "merge_databases": self._do_merge_databases,
+                "set_database_expiry": self._do_set_database_expiry,
+                "edit_steam_webapi_key": self._do_edit_steam_webapi_key,
+                "comparison_report": self._do_generate_metadata_comparison_report,
+            }
+
             logger.info("Finished MainContent initialization")
             self.initialized = True
 
@@ -341,13 +679,10 @@ class MainContent(QObject):
         not throw a fatal error trying to load mods until the
         user has had a chance to set paths.
         """
-        current_instance = self.settings_controller.settings.current_instance
-        game_folder_path = self.settings_controller.settings.instances[
-            current_instance
-        ].game_folder
-        config_folder_path = self.settings_controller.settings.instances[
-            current_instance
-        ].config_folder
+        settings = self.settings_controller.settings
+        instance = settings.instances[settings.current_instance]
+        game_folder_path = instance.game_folder
+        config_folder_path = instance.config_folder
         logger.debug(f"Game folder: {game_folder_path}")
         logger.debug(f"Config folder: {config_folder_path}")
         if (
@@ -398,11 +733,12 @@ class MainContent(QObject):
         """
         aml = self.mods_panel.active_mods_list
         iml = self.mods_panel.inactive_mods_list
+        user_role = Qt.ItemDataRole.UserRole
         if key == "Left":
             iml.setFocus()
             if not iml.selectedIndexes():
                 iml.setCurrentRow(self.___get_relative_middle(iml))
-            data = iml.selectedItems()[0].data(Qt.ItemDataRole.UserRole)
+            data = iml.selectedItems()[0].data(user_role)
             uuid = data["uuid"]
             self.__mod_list_slot(uuid)
 
@@ -416,7 +752,7 @@ class MainContent(QObject):
 
                 # Remove items from current list
                 for item in items_to_move:
-                    data = item.data(Qt.ItemDataRole.UserRole)
+                    data = item.data(user_role)
                     uuid = data["uuid"]
                     aml.uuids.remove(uuid)
                     aml.takeItem(aml.row(item))
@@ -434,8 +770,7 @@ class MainContent(QObject):
                 for item in items_to_move:
                     iml.insertItem(count, item)
                     count += 1
-            self.mods_panel.active_mods_list.recalculate_warnings_signal.emit()
-            self.mods_panel.inactive_mods_list.recalculate_warnings_signal.emit()
+            self._schedule_warnings_recalc()
 
     def __handle_inactive_mod_key_press(self, key: str) -> None:
         """
@@ -452,11 +787,12 @@ class MainContent(QObject):
 
         aml = self.mods_panel.active_mods_list
         iml = self.mods_panel.inactive_mods_list
+        user_role = Qt.ItemDataRole.UserRole
         if key == "Right":
             aml.setFocus()
             if not aml.selectedIndexes():
                 aml.setCurrentRow(self.___get_relative_middle(aml))
-            data = aml.selectedItems()[0].data(Qt.ItemDataRole.UserRole)
+            data = aml.selectedItems()[0].data(user_role)
             uuid = data["uuid"]
             self.__mod_list_slot(uuid)
 
@@ -470,7 +806,7 @@ class MainContent(QObject):
 
                 # Remove items from current list
                 for item in items_to_move:
-                    data = item.data(Qt.ItemDataRole.UserRole)
+                    data = item.data(user_role)
                     uuid = data["uuid"]
                     iml.uuids.remove(uuid)
                     iml.takeItem(iml.row(item))
@@ -488,8 +824,22 @@ class MainContent(QObject):
                 for item in items_to_move:
                     aml.insertItem(count, item)
                     count += 1
-            self.mods_panel.active_mods_list.recalculate_warnings_signal.emit()
-            self.mods_panel.inactive_mods_list.recalculate_warnings_signal.emit()
+            self._schedule_warnings_recalc()
+
+    def _schedule_warnings_recalc(self) -> None:
+        """
+        Coalesce warning recalculation for both mod lists into a single pass
+        per event loop iteration.
+        """
+        if self._warnings_recalc_pending:
+            return
+        self._warnings_recalc_pending = True
+        QTimer.singleShot(0, self._flush_warnings_recalc)
+
+    def _flush_warnings_recalc(self) -> None:
+        self._warnings_recalc_pending = False
+        self.mods_panel.active_mods_list.recalculate_warnings_signal.emit()
+        self.mods_panel.inactive_mods_list.recalculate_warnings_signal.emit()
 
     def __insert_data_into_lists(
         self, active_mods_uuids: list[str], inactive_mods_uuids: list[str]
@@ -540,21 +890,14 @@ class MainContent(QObject):
             self.settings_controller.settings.try_download_missing_mods
             and self.metadata_manager.external_steam_metadata
         ):  # Do we even have metadata to lookup...?
-            self.missing_mods_prompt = MissingModsPrompt(
-                packageids=self.missing_mods,
-                steam_workshop_metadata=self.metadata_manager.external_steam_metadata,
-            )
-            self.missing_mods_prompt._populate_from_metadata()
-            self.missing_mods_prompt.steamcmd_downloader_signal.connect(
-                self._do_download_mods_with_steamcmd
-            )
-            self.missing_mods_prompt.steamworks_subscription_signal.connect(
-                self._do_steamworks_api_call_animated
-            )
-            self.missing_mods_prompt.setWindowModality(
-                Qt.WindowModality.ApplicationModal
-            )
-            self.missing_mods_prompt.show()
+            # Looking up variants walks the whole Steam DB, so do it off the UI thread
+            task = MissingModsVariantsTask(
+                self,
+                packageids=list(self.missing_mods),
+                # Shallow snapshot so the DB can't change size while it is iterated
+                steam_workshop_metadata=self.metadata_manager.external_steam_metadata.copy(),
+            )
+            QThreadPool.globalInstance().start(task)
         else:
             list_of_missing_mods = "\n".join([f"* {mod}" for mod in self.missing_mods])
             dialogue.show_information(
@@ -567,6 +910,24 @@ class MainContent(QObject):
                 details=list_of_missing_mods,
             )
 
+    @Slot(list, dict)
+    def _on_missing_mods_variants_ready(
+        self, packageids: list[str], data_by_variants: dict[str, Any]
+    ) -> None:
+        self.missing_mods_prompt = MissingModsPrompt(
+            packageids=packageids,
+            steam_workshop_metadata=self.metadata_manager.external_steam_metadata,
+        )
+        self.missing_mods_prompt._populate_from_variants(data_by_variants)
+        self.missing_mods_prompt.steamcmd_downloader_signal.connect(
+            self._do_download_mods_with_steamcmd
+        )
+        self.missing_mods_prompt.steamworks_subscription_signal.connect(
+            self._do_steamworks_api_call_animated
+        )
+        self.missing_mods_prompt.setWindowModality(Qt.WindowModality.ApplicationModal)
+        self.missing_mods_prompt.show()
+
     def __mod_list_slot(self, uuid: str) -> None:
         """
         This slot method is triggered when the user clicks on an item
@@ -587,22 +948,16 @@ class MainContent(QObject):
         restore variables.
         """
         logger.info("Repopulating mod lists")
+        settings = self.settings_controller.settings
+        config_folder = settings.instances[settings.current_instance].config_folder
+        self._invalidate_active_mods_snapshot()
         (
             active_mods_uuids,
             inactive_mods_uuids,
             self.duplicate_mods,
             self.missing_mods,
         ) = metadata.get_mods_from_list(
-            mod_list=str(
-                (
-                    Path(
-                        self.settings_controller.settings.instances[
-                            self.settings_controller.settings.current_instance
-                        ].config_folder
-                    )
-                    / "ModsConfig.xml"
-                )
-            )
+            mod_list=str(Path(config_folder) / "ModsConfig.xml")
         )
         self.active_mods_uuids_last_save = active_mods_uuids
         if is_initial:
@@ -625,142 +980,96 @@ class MainContent(QObject):
         :param action: string indicating action
         """
         logger.info(f"USER ACTION: received action {action}")
-        # game configuration panel actions
-        if action == "check_for_update":
-            self._do_check_for_update()
-        # actions panel actions
-        if action == "refresh":
-            self._do_refresh()
-        if action == "clear":
-            self._do_clear()
-        if action == "restore":
-            self._do_restore()
-        if action == "sort":
-            self._do_sort()
-        if "textures" in action:
-            logger.debug("Initiating new todds operation...")
-            # Setup Environment
-            todds_txt_path = str((Path(gettempdir()) / "todds.txt"))
-            if os.path.exists(todds_txt_path):
-                os.remove(todds_txt_path)
-            if not self.settings_controller.settings.todds_active_mods_target:
-                local_mods_target = self.settings_controller.settings.instances[
-                    self.settings_controller.settings.current_instance
-                ].local_folder
-                if local_mods_target and local_mods_target != "":
-                    with open(todds_txt_path, "a", encoding="utf-8") as todds_txt_file:
-                        todds_txt_file.write(local_mods_target + "\n")
-                workshop_mods_target = self.settings_controller.settings.instances[
-                    self.settings_controller.settings.current_instance
-                ].workshop_folder
-                if workshop_mods_target and workshop_mods_target != "":
-                    with open(todds_txt_path, "a", encoding="utf-8") as todds_txt_file:
-                        todds_txt_file.write(workshop_mods_target + "\n")
-            else:
-                with open(todds_txt_path, "a", encoding="utf-8") as todds_txt_file:
-                    for uuid in self.mods_panel.active_mods_list.uuids:
-                        todds_txt_file.write(
-                            self.metadata_manager.internal_local_metadata[uuid]["path"]
-                            + "\n"
-                        )
-            if action == "optimize_textures":
-                self._do_optimize_textures(todds_txt_path)
-            if action == "delete_textures":
-                self._do_delete_dds_textures(todds_txt_path)
-        if action == "add_git_mod":
-            self._do_add_git_mod()
-        if action == "browse_workshop":
-            self._do_browse_workshop()
-        if action == "import_steamcmd_acf_data":
-            metadata.import_steamcmd_acf_data(
-                rimsort_storage_path=str(AppInfo().app_storage_folder),
-                steamcmd_appworkshop_acf_path=self.steamcmd_wrapper.steamcmd_appworkshop_acf_path,
-            )
-        if action == "reset_steamcmd_acf_data":
-            if os.path.exists(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path):
-                logger.debug(
-                    f"Deleting SteamCMD ACF data: {self.steamcmd_wrapper.steamcmd_appworkshop_acf_path}"
-                )
-                os.remove(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path)
-            else:
-                logger.debug("SteamCMD ACF data does not exist. Skipping action.")
-        if action == "update_workshop_mods":
-            self._do_check_for_workshop_updates()
-        if action == "import_list_file_xml":
-            self._do_import_list_file_xml()
-        if action == "import_list_rentry":
-            self._do_import_list_rentry()
-        if action == "export_list_file_xml":
-            self._do_export_list_file_xml()
-        if action == "export_list_clipboard":
-            self._do_export_list_clipboard()
-        if action == "upload_list_rentry":
-            self._do_upload_list_rentry()
-        if action == "save":
-            self._do_save()
-        # settings panel actions
-        if action == "configure_github_identity":
-            self._do_configure_github_identity()
-        if action == "configure_steam_database_path":
-            self._do_configure_steam_db_file_path()
-        if action == "configure_steam_database_repo":
-            self._do_configure_steam_database_repo()
-        if action == "download_steam_database":
-            if GIT_EXISTS:
-                self._do_clone_repo_to_path(
-                    base_path=str(AppInfo().databases_folder),
-                    repo_url=self.settings_controller.settings.external_steam_metadata_repo,
-                )
-            else:
-                self._do_notify_no_git()
-        if action == "upload_steam_database":
-            if GIT_EXISTS:
-                self._do_upload_db_to_repo(
-                    repo_url=self.settings_controller.settings.external_steam_metadata_repo,
-                    file_name="steamDB.json",
-                )
-            else:
-                self._do_notify_no_git()
-        if action == "configure_community_rules_db_path":
-            self._do_configure_community_rules_db_file_path()
-        if action == "configure_community_rules_db_repo":
-            self._do_configure_community_rules_db_repo()
-        if action == "download_community_rules_database":
-            if GIT_EXISTS:
-                self._do_clone_repo_to_path(
-                    base_path=str(AppInfo().databases_folder),
-                    repo_url=self.settings_controller.settings.external_community_rules_repo,
-                )
-            else:
-                self._do_notify_no_git()
-        if action == "open_community_rules_with_rule_editor":
-            self._do_open_rule_editor(compact=False, initial_mode="community_rules")
-        if action == "upload_community_rules_database":
-            if GIT_EXISTS:
-                self._do_upload_db_to_repo(
-                    repo_url=self.settings_controller.settings.external_community_rules_repo,
-                    file_name="communityRules.json",
-                )
-            else:
-                self._do_notify_no_git()
-        if action == "build_steam_database_thread":
-            self._do_build_database_thread()
-        if "download_entire_workshop" in action:
+        handler = self._actions.get(action)
+        if handler is not None:
+            handler()
+        elif "download_entire_workshop" in action:
             self._do_download_entire_workshop(action)
-        if action == "merge_databases":
-            self._do_merge_databases()
-        if action == "set_database_expiry":
-            self._do_set_database_expiry()
-        if action == "edit_steam_webapi_key":
-            self._do_edit_steam_webapi_key()
-        if action == "comparison_report":
-            self._do_generate_metadata_comparison_report()
+
+    def _do_todds_action(self, action: str) -> None:
+        logger.debug("Initiating new todds operation...")
+        # Setup Environment
+        todds_txt_path = str((Path(gettempdir()) / "todds.txt"))
+        settings = self.settings_controller.settings
+        lines: list[str] = []
+        if not settings.todds_active_mods_target:
+            instance = settings.instances[settings.current_instance]
+            if instance.local_folder:
+                lines.append(instance.local_folder)
+            if instance.workshop_folder:
+                lines.append(instance.workshop_folder)
+        else:
+            md = self.metadata_manager.internal_local_metadata
+            # Skip stale uuids that no longer have metadata
+            lines.extend(
+                md[uuid]["path"]
+                for uuid in self.mods_panel.active_mods_list.uuids
+                if uuid in md
+            )
+        # Overwrite any previous target list in a single write
+        Path(todds_txt_path).write_text(
+            "".join(f"{line}\n" for line in lines), encoding="utf-8"
+        )
+        if action == "optimize_textures":
+            self._do_optimize_textures(todds_txt_path)
+        elif action == "delete_textures":
+            self._do_delete_dds_textures(todds_txt_path)
+
+    def _do_import_steamcmd_acf_data(self) -> None:
+        metadata.import_steamcmd_acf_data(
+            rimsort_storage_path=str(AppInfo().app_storage_folder),
+            steamcmd_appworkshop_acf_path=self.steamcmd_wrapper.steamcmd_appworkshop_acf_path,
+        )
+
+    def _do_reset_steamcmd_acf_data(self) -> None:
+        if os.path.exists(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path):
+            logger.debug(
+                f"Deleting SteamCMD ACF data: {self.steamcmd_wrapper.steamcmd_appworkshop_acf_path}"
+            )
+            os.remove(self.steamcmd_wrapper.steamcmd_appworkshop_acf_path)
+        else:
+            logger.debug("SteamCMD ACF data does not exist. Skipping action.")
+
+    def _do_download_database(self, repo_setting: str) -> None:
+        """
+        Clone the database repository configured in the given setting
+
+        :param repo_setting: name of the settings attribute holding the repo URL
+        """
+        if GIT_EXISTS:
+            self._do_clone_repo_to_path(
+                base_path=str(AppInfo().databases_folder),
+                repo_url=getattr(self.settings_controller.settings, repo_setting),
+                shallow=True,
+            )
+        else:
+            self._do_notify_no_git()
+
+    def _do_upload_database(self, repo_setting: str, file_name: str) -> None:
+        """
+        Upload a database file to the repository configured in the given setting
+
+        :param repo_setting: name of the settings attribute holding the repo URL
+        :param file_name: name of the database file to upload
+        """
+        if GIT_EXISTS:
+            self._do_upload_db_to_repo(
+                repo_url=getattr(self.settings_controller.settings, repo_setting),
+                file_names=[file_name],
+            )
+        else:
+            self._do_notify_no_git()
 
     # GAME CONFIGURATION PANEL
 
     def _do_check_for_update(self) -> None:
         logger.debug("Skipping update check...")
         return
+        # Only needed by the updater, so keep them out of the startup import graph
+        import platform
+        import subprocess
+        import sys
+
         # NOT NUITKA
         if "__compiled__" not in globals():
             logger.debug(
@@ -775,16 +1084,28 @@ class MainContent(QObject):
         # NUITKA
         logger.debug("Checking for RimSort update...")
         current_version = self.metadata_manager.game_version
-        try:
-            json_response = self.__do_get_github_release_info()
-        except Exception as e:
-            logger.warning(
-                f"Unable to retrieve latest release information due to exception: {e.__class__}"
+        # Query GitHub off the UI thread; failures are logged by the worker
+        json_response = self.do_threaded_loading_animation(
+            gif_path=str(AppInfo().theme_data_folder / "default-icons" / "refresh.gif"),
+            target=self.__do_get_github_release_info,
+            text="Checking for RimSort update...",
+        )
+        if not json_response:
+            logger.warning("Unable to retrieve latest release information")
+            return
+        if "error" in json_response:
+            dialogue.show_warning(
+                title="Unable to check for update",
+                text="GitHub is rate limiting requests from this network.",
+                information=json_response["error"],
             )
             return
+        # Index the release assets once so any lookup by name is O(1)
+        assets_by_name = {
+            asset["name"]: asset for asset in json_response.get("assets", [])
+        }
         tag_name = json_response["tag_name"]
         tag_name_updated = tag_name.replace("alpha", "Alpha")
-        install_path = os.getcwd()
         logger.debug(f"Current RimSort release found: {tag_name}")
         logger.debug(f"Current RimSort version found: {current_version}")
         if current_version != tag_name:
@@ -796,7 +1117,6 @@ class MainContent(QObject):
             if answer == "&Yes":
                 # Setup environment
                 ARCH = platform.architecture()[0]
-                CWD = os.getcwd()
                 PROCESSOR = platform.processor()
                 if PROCESSOR == "":
                     PROCESSOR = platform.machine()
@@ -804,52 +1124,47 @@ class MainContent(QObject):
 
                 current_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
 
+                archive_key: tuple[str, str | None]
                 if SYSTEM == "Darwin":
                     current_dir = os.path.split(
                         os.path.split(os.path.dirname(os.path.abspath(sys.argv[0])))[0]
                     )[0]
-                    executable_name = "RimSort.app"
                     if PROCESSOR == "i386" or PROCESSOR == "arm":
                         logger.warning(
                             f"Darwin/MacOS system detected with a {ARCH} {PROCESSOR} CPU..."
                         )
-                        target_archive = (
-                            f"RimSort-{tag_name_updated}_{SYSTEM}_{PROCESSOR}.zip"
-                        )
+                        archive_key = (SYSTEM, PROCESSOR)
                     else:
                         logger.warning(
                             f"Unsupported processor {SYSTEM} {ARCH} {PROCESSOR}"
                         )
                         return
                 elif SYSTEM == "Linux":
-                    executable_name = "RimSort.bin"
                     logger.warning(
                         f"Linux system detected with a {ARCH} {PROCESSOR} CPU..."
                     )
-                    target_archive = (
-                        f"RimSort-{tag_name_updated}_{SYSTEM}_{PROCESSOR}.zip"
-                    )
+                    archive_key = (SYSTEM, None)
                 elif SYSTEM == "Windows":
-                    executable_name = "RimSort.exe"
                     logger.warning(
                         f"Windows system detected with a {ARCH} {PROCESSOR} CPU..."
                     )
-                    target_archive = f"RimSort-{tag_name_updated}_{SYSTEM}.zip"
+                    archive_key = (SYSTEM, None)
                 else:
                     logger.warning(f"Unsupported system {SYSTEM} {ARCH} {PROCESSOR}")
                     return
+                target_archive = _ARCHIVE_FMTS[archive_key].format(
+                    tag=tag_name_updated, proc=PROCESSOR
+                )
                 # Try to find a valid release from our generated archive name
-                for asset in json_response["assets"]:
-                    if asset["name"] == target_archive:
-                        browser_download_url = asset["browser_download_url"]
+                asset = assets_by_name.get(target_archive)
                 # If we don't have it from our query...
-                if "browser_download_url" not in locals():
+                if asset is None:
                     dialogue.show_warning(
                         title="Unable to complete update",
                         text=f"Failed to find valid RimSort release for {SYSTEM} {ARCH} {PROCESSOR}",
                     )
                     return
-                target_archive_extracted = target_archive.replace(".zip", "")
+                browser_download_url = asset["browser_download_url"]
                 try:
                     logger.debug(
                         f"Downloading & extracting RimSort release from: {browser_download_url}"
@@ -939,15 +1254,65 @@ class MainContent(QObject):
         platform_specific_open("steam://validate/294100")
 
     def __do_download_extract_release_to_tempdir(self, url: str) -> None:
-        with ZipFile(BytesIO(requests_get(url).content)) as zipobj:
-            zipobj.extractall(gettempdir())
+        from tempfile import NamedTemporaryFile
+        from zipfile import ZipFile
+
+        with NamedTemporaryFile(delete=False, suffix=".zip") as archive:
+            archive_path = archive.name
+        # Remove the archive however this ends, including a failed download
+        try:
+            # Stream the archive to disk rather than buffering the whole release
+            with (
+                _gh_get(url, stream=True, timeout=30) as response,
+                open(archive_path, "wb") as archive,
+            ):
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, archive, length=1024 * 1024)
+            with ZipFile(archive_path) as zipobj:
+                zipobj.extractall(gettempdir())
+        finally:
+            os.unlink(archive_path)
 
     def __do_get_github_release_info(self) -> dict[str, Any]:
+        """
+        Fetch the latest RimSort release info from GitHub.
+
+        Runs on a worker thread. Returns an "error" entry instead of raising
+        when GitHub rate limits the request, so it can be shown to the user.
+        """
+        # Reuse the last response if GitHub reports it unchanged (HTTP 304)
+        cache_path = AppInfo().app_storage_folder / "github_release_cache.json"
+        cached: dict[str, Any] = {}
+        if cache_path.exists():
+            try:
+                cached = _json_loads(cache_path.read_bytes())
+            except (OSError, msgspec.DecodeError) as e:
+                logger.debug(f"Ignoring unreadable GitHub release cache: {e}")
+        headers: dict[str, str] = {}
+        if cached.get("etag") and cached.get("body"):
+            headers["If-None-Match"] = cached["etag"]
         # Parse latest release
-        raw = requests_get(
-            "https://api.github.com/repos/RimSort/RimSort/releases/latest"
-        )
-        return raw.json()
+        try:
+            raw = _gh_get(
+                "https://api.github.com/repos/RimSort/RimSort/releases/latest",
+                headers=headers,
+            )
+        except _GitHubRateLimited as e:
+            logger.warning(e)
+            return {"error": str(e)}
+        if raw.status_code == 304 and cached.get("body"):
+            logger.debug("GitHub release info unchanged, using cached response")
+            return cached["body"]
+        json_response = raw.json()
+        etag = raw.headers.get("ETag")
+        if raw.status_code == 200 and etag:
+            try:
+                cache_path.write_bytes(
+                    _json_dumps({"etag": etag, "body": json_response})
+                )
+            except OSError as e:
+                logger.debug(f"Unable to write GitHub release cache: {e}")
+        return json_response
 
     # INFO PANEL ANIMATIONS
 
@@ -991,25 +1356,17 @@ class MainContent(QObject):
         """
         Refresh expensive calculations & repopulate lists with that refreshed data
         """
-        EventBus().refresh_started.emit()
-        EventBus().do_save_button_animation_stop.emit()
+        _BUS.refresh_started.emit()
+        _BUS.do_save_button_animation_stop.emit()
         # If we are refreshing cache from user action
         if not is_initial:
             # Reset the data source filters to default and clear searches
-            self.mods_panel.active_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.signal_clear_search(list_type="Active")
-            self.mods_panel.inactive_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.signal_clear_search(list_type="Inactive")
-            self.mods_panel.active_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
+            self.mods_panel.active_mods_filter_data_source_index = (
+                self.mods_panel.default_filter_index
             )
             self.mods_panel.signal_clear_search(list_type="Active")
-            self.mods_panel.inactive_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
+            self.mods_panel.inactive_mods_filter_data_source_index = (
+                self.mods_panel.default_filter_index
             )
             self.mods_panel.signal_clear_search(list_type="Inactive")
         # Check if paths are set
@@ -1069,19 +1426,19 @@ class MainContent(QObject):
                 loop.exec_()
                 logger.debug("Settings dialog closed. Continuing with refresh...")
 
-        EventBus().refresh_finished.emit()
+        _BUS.refresh_finished.emit()
 
     def _do_clear(self) -> None:
         """
         Method to clear all the non-base, non-DLC mods from the active
         list widget and put them all into the inactive list widget.
         """
-        self.mods_panel.active_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
+        self.mods_panel.active_mods_filter_data_source_index = (
+            self.mods_panel.default_filter_index
         )
         self.mods_panel.signal_clear_search(list_type="Active")
-        self.mods_panel.inactive_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
+        self.mods_panel.inactive_mods_filter_data_source_index = (
+            self.mods_panel.default_filter_index
         )
         self.mods_panel.signal_clear_search(list_type="Inactive")
         # Metadata to insert
@@ -1096,26 +1453,22 @@ class MainContent(QObject):
             app_constants.RIMWORLD_DLC_METADATA["1826140"]["packageid"],
             app_constants.RIMWORLD_DLC_METADATA["2380740"]["packageid"],
         ]
-        # Create a set of all package IDs from mod_data
-        package_ids_set = set(
-            mod_data["packageid"]
-            for mod_data in self.metadata_manager.internal_local_metadata.values()
-        )
-        # Iterate over the DLC package IDs in the correct order
+        # Bin expansion UUIDs by package ID in a single pass over mod_data
+        expansion_uuids_by_package_id: dict[str, list[str]] = {}
+        for uuid, mod_data in self.metadata_manager.internal_local_metadata.items():
+            if mod_data["data_source"] == "expansion":
+                expansion_uuids_by_package_id.setdefault(
+                    mod_data["packageid"], []
+                ).append(uuid)
+        # Add the DLC UUIDs to active_mods_uuids in the correct order
         for package_id in package_id_order:
-            if package_id in package_ids_set:
-                # Append the UUIDs to active_mods_uuids if the package ID exists in mod_data
-                active_mods_uuids.extend(
-                    uuid
-                    for uuid, mod_data in self.metadata_manager.internal_local_metadata.items()
-                    if mod_data["data_source"] == "expansion"
-                    and mod_data["packageid"] == package_id
-                )
+            active_mods_uuids.extend(expansion_uuids_by_package_id.get(package_id, []))
         # Append the remaining UUIDs to inactive_mods_uuids
+        active_mods_uuids_set = set(active_mods_uuids)
         inactive_mods_uuids.extend(
             uuid
             for uuid in self.metadata_manager.internal_local_metadata.keys()
-            if uuid not in active_mods_uuids
+            if uuid not in active_mods_uuids_set
         )
         # Disable widgets while inserting
         self.disable_enable_widgets_signal.emit(False)
@@ -1132,21 +1485,12 @@ class MainContent(QObject):
         # Get the live list of active and inactive mods. This is because the user
         # will likely sort before saving.
         logger.debug("Starting sorting mods")
-        self.mods_panel.signal_clear_search(list_type="Active")
-        self.mods_panel.active_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.on_active_mods_search_data_source_filter()
-        self.mods_panel.signal_clear_search(list_type="Inactive")
-        self.mods_panel.inactive_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.on_inactive_mods_search_data_source_filter()
-        active_package_ids = set()
-        for uuid in self.mods_panel.active_mods_list.uuids:
-            active_package_ids.add(
-                self.metadata_manager.internal_local_metadata[uuid]["packageid"]
-            )
+        self.mods_panel.reset_both_filters_to_all()
+        internal_local_metadata = self.metadata_manager.internal_local_metadata
+        active_package_ids = {
+            internal_local_metadata[uuid]["packageid"]
+            for uuid in self.mods_panel.active_mods_list.uuids
+        }
 
         # Get the current order of active mods list
         current_order = self.mods_panel.active_mods_list.uuids.copy()
@@ -1168,6 +1512,8 @@ class MainContent(QObject):
             logger.info(
                 "Finished combining all tiers of mods. Inserting into mod lists!"
             )
+            # Build the sorted set once, not once per uuid in the comprehension
+            sorted_uuids = set(new_order)
             # Disable widgets while inserting
             self.disable_enable_widgets_signal.emit(False)
             # Insert data into lists
@@ -1176,7 +1522,7 @@ class MainContent(QObject):
                 [
                     uuid
                     for uuid in self.metadata_manager.internal_local_metadata
-                    if uuid not in set(new_order)
+                    if uuid not in sorted_uuids
                 ],
             )
             # Enable widgets again after inserting
@@ -1200,16 +1546,7 @@ class MainContent(QObject):
         )
         logger.info(f"Selected path: {file_path}")
         if file_path:
-            self.mods_panel.signal_clear_search(list_type="Active")
-            self.mods_panel.active_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.signal_search_source_filter(list_type="Active")
-            self.mods_panel.signal_clear_search(list_type="Inactive")
-            self.mods_panel.inactive_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.signal_search_source_filter(list_type="Inactive")
+            self.mods_panel.reset_both_filters_to_all()
             logger.info(f"Trying to import mods list from XML: {file_path}")
             (
                 active_mods_uuids,
@@ -1252,11 +1589,13 @@ class MainContent(QObject):
         if file_path:
             logger.info("Exporting current active mods to ModsConfig.xml format")
             active_mods = []
+            # Mirror of active_mods for O(1) duplicate checks
+            seen: set[str] = set()
             for uuid in self.mods_panel.active_mods_list.uuids:
                 package_id = self.metadata_manager.internal_local_metadata[uuid][
                     "packageid"
                 ]
-                if package_id in active_mods:  # This should NOT be happening
+                if package_id in seen:  # This should NOT be happening
                     logger.critical(
                         f"Tried to export more than 1 identical package ids to the same mod list. Skipping duplicate {package_id}"
                     )
@@ -1272,8 +1611,10 @@ class MainContent(QObject):
                             == "workshop"
                         ):
                             active_mods.append(package_id + "_steam")
+                            seen.add(package_id + "_steam")
                             continue  # Append `_steam` suffix if Steam mod, continue to next mod
                     active_mods.append(package_id)
+                    seen.add(package_id)
             logger.info(f"Collected {len(active_mods)} active mods for export")
             mods_config_data = generate_rimworld_mods_list(
                 self.metadata_manager.game_version, active_mods
@@ -1306,16 +1647,7 @@ class MainContent(QObject):
             logger.debug("USER ACTION: pressed cancel or no package IDs, passing")
             return
         # Clear Active and Inactive search and data source filter
-        self.mods_panel.signal_clear_search(list_type="Active")
-        self.mods_panel.active_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.signal_search_source_filter(list_type="Active")
-        self.mods_panel.signal_clear_search(list_type="Inactive")
-        self.mods_panel.inactive_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.signal_search_source_filter(list_type="Inactive")
+        self.mods_panel.reset_both_filters_to_all()
 
         # Log the attempt to import mods list from Rentry.co
         logger.info(
@@ -1352,7 +1684,9 @@ class MainContent(QObject):
 
     def _do_import_list_workshop_collection(self) -> None:
         # Create an instance of collection_import
-        collection_import = CollectionImport(metadata_manager=self.metadata_manager)
+        collection_import = CollectionImport(
+            metadata_manager=self.metadata_manager, session=_HTTP_SESSION
+        )
 
         # Trigger the import dialogue and get the result
         collection_import.import_collection_link()
@@ -1362,16 +1696,7 @@ class MainContent(QObject):
             logger.debug("USER ACTION: pressed cancel or no package IDs, passing")
             return
         # Clear Active and Inactive search and data source filter
-        self.mods_panel.signal_clear_search(list_type="Active")
-        self.mods_panel.active_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.signal_search_source_filter(list_type="Active")
-        self.mods_panel.signal_clear_search(list_type="Inactive")
-        self.mods_panel.inactive_mods_filter_data_source_index = len(
-            self.mods_panel.data_source_filter_icons
-        )
-        self.mods_panel.signal_search_source_filter(list_type="Inactive")
+        self.mods_panel.reset_both_filters_to_all()
 
         # Log the attempt to import mods list from Workshop collection
         logger.info(
@@ -1406,20 +1731,29 @@ class MainContent(QObject):
         if self.missing_mods and len(self.missing_mods) >= 1:
             self.__missing_mods_prompt()
 
-    def _do_export_list_clipboard(self) -> None:
+    def _snapshot_active_mods(
+        self,
+    ) -> tuple[list[str], dict[str, str], set[str]]:
         """
-        Export the current list of active mods to the clipboard in a
-        readable format. The current list does not need to have been saved.
+        Collect the package ids of the active mods list, in order and without
+        duplicates. The result is reused until the active mods list changes.
+
+        :return: a tuple of the package ids, a map of package id -> uuid and a
+            set of the package ids
         """
-        logger.info("Generating report to export mod list to clipboard")
-        # Build our lists
+        uuids = tuple(self.mods_panel.active_mods_list.uuids)
+        if (
+            self._active_mods_snapshot is not None
+            and self._active_mods_snapshot[0] == uuids
+        ):
+            return self._active_mods_snapshot[1]
         active_mods = []
+        active_mods_seen: set[str] = set()
         active_mods_packageid_to_uuid = {}
-        for uuid in self.mods_panel.active_mods_list.uuids:
-            package_id = self.metadata_manager.internal_local_metadata[uuid][
-                "packageid"
-            ]
-            if package_id in active_mods:  # This should NOT be happening
+        uuid_to_packageid = self.metadata_manager.uuid_to_packageid
+        for uuid in uuids:
+            package_id = uuid_to_packageid[uuid]
+            if package_id in active_mods_seen:  # This should NOT be happening
                 logger.critical(
                     "Tried to export more than 1 identical package ids to the same mod list. "
                     + f"Skipping duplicate {package_id}"
@@ -1427,32 +1761,38 @@ class MainContent(QObject):
                 continue
             else:  # Otherwise, proceed with adding the mod package_id
                 active_mods.append(package_id)
+                active_mods_seen.add(package_id)
                 active_mods_packageid_to_uuid[package_id] = uuid
+        snapshot = (active_mods, active_mods_packageid_to_uuid, active_mods_seen)
+        self._active_mods_snapshot = (uuids, snapshot)
+        return snapshot
+
+    def _invalidate_active_mods_snapshot(self, uuid: str | None = None) -> None:
+        # Metadata updates may change a uuid's package id, so drop the snapshot
+        self._active_mods_snapshot = None
+
+    def _do_export_list_clipboard(self) -> None:
+        """
+        Export the current list of active mods to the clipboard in a
+        readable format. The current list does not need to have been saved.
+        """
+        logger.info("Generating report to export mod list to clipboard")
+        # Build our lists
+        active_mods, active_mods_packageid_to_uuid, _ = self._snapshot_active_mods()
+        local_md = self.metadata_manager.internal_local_metadata
         logger.info(f"Collected {len(active_mods)} active mods for export")
-        # Build our report
-        active_mods_clipboard_report = (
+        # Build our report from fragments, joined once at the end
+        parts: list[str] = [
             f"Created with RimSort {AppInfo().app_version}"
             + f"\nRimWorld game version this list was created for: {self.metadata_manager.game_version}"
             + f"\nTotal # of mods: {len(active_mods)}\n"
-        )
+        ]
         for package_id in active_mods:
-            uuid = active_mods_packageid_to_uuid[package_id]
-            if self.metadata_manager.internal_local_metadata[uuid].get("name"):
-                name = self.metadata_manager.internal_local_metadata[uuid]["name"]
-            else:
-                name = "No name specified"
-            if self.metadata_manager.internal_local_metadata[uuid].get("url"):
-                url = self.metadata_manager.internal_local_metadata[uuid]["url"]
-            elif self.metadata_manager.internal_local_metadata[uuid].get("steam_url"):
-                url = self.metadata_manager.internal_local_metadata[uuid]["steam_url"]
-            else:
-                url = "No url specified"
-            active_mods_clipboard_report = (
-                active_mods_clipboard_report
-                + f"\n{name} "
-                + f"[{package_id}]"
-                + f"[{url}]"
-            )
+            md = local_md[active_mods_packageid_to_uuid[package_id]]
+            name = md.get("name") or "No name specified"
+            url = md.get("url") or md.get("steam_url") or "No url specified"
+            parts.append(f"\n{name} [{package_id}][{url}]")
+        active_mods_clipboard_report = "".join(parts)
         # Copy report to clipboard
         dialogue.show_information(
             title="Export active mod list",
@@ -1468,146 +1808,116 @@ class MainContent(QObject):
         readable format. The current list does not need to have been saved.
         """
         # Define our lists
-        active_mods = []
-        active_mods_packageid_to_uuid = {}
+        active_mods, active_mods_packageid_to_uuid, _ = self._snapshot_active_mods()
         active_steam_mods_packageid_to_pfid = {}
         active_steam_mods_pfid_to_preview_url = {}
         pfids = []
         # Build our lists
-        for uuid in self.mods_panel.active_mods_list.uuids:
-            package_id = MetadataManager.instance().internal_local_metadata[uuid][
-                "packageid"
-            ]
-            if package_id in active_mods:  # This should NOT be happening
-                logger.critical(
-                    "Tried to export more than 1 identical package ids to the same mod list. "
-                    + f"Skipping duplicate {package_id}"
-                )
-                continue
-            else:  # Otherwise, proceed with adding the mod package_id
-                active_mods.append(package_id)
-                active_mods_packageid_to_uuid[package_id] = uuid
-                if (
-                    self.metadata_manager.internal_local_metadata[uuid].get("steamcmd")
-                    or self.metadata_manager.internal_local_metadata[uuid][
-                        "data_source"
-                    ]
-                    == "workshop"
-                ) and self.metadata_manager.internal_local_metadata[uuid].get(
-                    "publishedfileid"
-                ):
-                    publishedfileid = self.metadata_manager.internal_local_metadata[
-                        uuid
-                    ]["publishedfileid"]
-                    active_steam_mods_packageid_to_pfid[package_id] = publishedfileid
-                    pfids.append(publishedfileid)
+        local_md = self.metadata_manager.internal_local_metadata
+        workshop_uuid_set = self.metadata_manager.workshop_uuid_set
+        for package_id in active_mods:
+            uuid = active_mods_packageid_to_uuid[package_id]
+            if uuid in workshop_uuid_set:
+                publishedfileid = local_md[uuid]["publishedfileid"]
+                active_steam_mods_packageid_to_pfid[package_id] = publishedfileid
+                pfids.append(publishedfileid)
         logger.info(f"Collected {len(active_mods)} active mods for export")
-        if len(pfids) > 0:  # No empty queries...
-            # Compile list of Steam Workshop publishing preview images that correspond
-            # to a Steam mod in the active mod list
-            webapi_response = ISteamRemoteStorage_GetPublishedFileDetails(pfids)
-            if webapi_response is not None:
-                for metadata in webapi_response:
-                    pfid = metadata["publishedfileid"]
-                    if metadata["result"] != 1:
-                        logger.warning("Rentry.co export: Unable to get data for mod!")
-                        logger.warning(
-                            f"Invalid result returned from WebAPI for mod {pfid}"
-                        )
-                    else:
-                        # Retrieve the preview image URL from the response
-                        active_steam_mods_pfid_to_preview_url[pfid] = metadata[
-                            "preview_url"
-                        ]
-        # Build our report
-        active_mods_rentry_report = (
+        # Compile list of Steam Workshop publishing preview images that correspond
+        # to a Steam mod in the active mod list. Only query the WebAPI for pfids
+        # that are missing from, or expired in, the preview url cache.
+        preview_url_cache = self._load_preview_url_cache()
+        now = time.time()
+        stale_pfids = []
+        for pfid in pfids:
+            cached = preview_url_cache.get(pfid)
+            if cached is not None and now - cached[0] < _PREVIEW_URL_CACHE_TTL:
+                active_steam_mods_pfid_to_preview_url[pfid] = cached[1]
+            else:
+                stale_pfids.append(pfid)
+        webapi_response = None
+        if stale_pfids:  # No empty queries...
+            # Keep the UI responsive during the WebAPI round trip
+            webapi_response = self.do_threaded_loading_animation(
+                gif_path=str(
+                    AppInfo().theme_data_folder / "default-icons" / "refresh.gif"
+                ),
+                target=partial(
+                    ISteamRemoteStorage_GetPublishedFileDetails,
+                    stale_pfids,
+                    session=_HTTP_SESSION,
+                ),
+                text="Retrieving mod preview images from Steam WebAPI...",
+            )
+        # Build our report from fragments, joined once at the end
+        parts = [
             "# RimWorld mod list       ![](https://github.com/RimSort/RimSort/blob/main/docs/rentry_preview.png?raw=true)"
             + f"\nCreated with RimSort {AppInfo().app_version}"
             + f"\nMod list was created for game version: `{self.metadata_manager.game_version}`"
             + "\n!!! info Local mods are marked as yellow labels with packageid in brackets."
             + f"\n\n\n\n!!! note Mod list length: `{len(active_mods)}`\n"
-        )
+        ]
+        if webapi_response is not None:
+            for metadata in webapi_response:
+                pfid = metadata["publishedfileid"]
+                if metadata["result"] != 1:
+                    logger.warning("Rentry.co export: Unable to get data for mod!")
+                    logger.warning(
+                        f"Invalid result returned from WebAPI for mod {pfid}"
+                    )
+                else:
+                    # Retrieve the preview image URL from the response
+                    preview_url = metadata["preview_url"]
+                    active_steam_mods_pfid_to_preview_url[pfid] = preview_url
+                    preview_url_cache[pfid] = (now, preview_url)
+            self._save_preview_url_cache()
         # Add a line for each mod
-        for package_id in active_mods:
-            count = active_mods.index(package_id) + 1
+        for count, package_id in enumerate(active_mods, start=1):
             uuid = active_mods_packageid_to_uuid[package_id]
-            if self.metadata_manager.internal_local_metadata[uuid].get("name"):
-                name = self.metadata_manager.internal_local_metadata[uuid]["name"]
-            else:
-                name = "No name specified"
-            if (
-                self.metadata_manager.internal_local_metadata[uuid].get("steamcmd")
-                or self.metadata_manager.internal_local_metadata[uuid]["data_source"]
-                == "workshop"
-            ) and active_steam_mods_packageid_to_pfid.get(package_id):
+            md = local_md[uuid]
+            name = md.get("name") or "No name specified"
+            if uuid in workshop_uuid_set:
                 pfid = active_steam_mods_packageid_to_pfid[package_id]
-                if active_steam_mods_pfid_to_preview_url.get(pfid):
-                    preview_url = (
-                        active_steam_mods_pfid_to_preview_url[pfid]
-                        + "?imw=100&imh=100&impolicy=Letterbox"
-                    )
+                if preview_url := active_steam_mods_pfid_to_preview_url.get(pfid):
+                    preview_url += "?imw=100&imh=100&impolicy=Letterbox"
                 else:
                     preview_url = "https://github.com/RimSort/RimSort/blob/main/docs/rentry_steam_icon.png?raw=true"
-                if self.metadata_manager.internal_local_metadata[uuid].get("steam_url"):
-                    url = self.metadata_manager.internal_local_metadata[uuid][
-                        "steam_url"
-                    ]
-                elif self.metadata_manager.internal_local_metadata[uuid].get("url"):
-                    url = self.metadata_manager.internal_local_metadata[uuid]["url"]
-                else:
-                    url is None
-                if url is None:
-                    if package_id in active_steam_mods_packageid_to_pfid.keys():
-                        active_mods_rentry_report = (
-                            active_mods_rentry_report
-                            + f"\n{str(count) + '.'} ![]({preview_url}) {name} packageid: {package_id}"
-                        )
-                else:
-                    if package_id in active_steam_mods_packageid_to_pfid.keys():
-                        active_mods_rentry_report = (
-                            active_mods_rentry_report
-                            + f"\n{str(count) + '.'} ![]({preview_url}) [{name}]({url} packageid: {package_id})"
-                        )
+                # Steam mods link to the workshop page first
+                url = md.get("steam_url") or md.get("url")
+                template = _RENTRY_STEAM_URL_TPL if url else _RENTRY_STEAM_TPL
+                parts.append(
+                    template.format(
+                        count=count,
+                        preview_url=preview_url,
+                        name=name,
+                        url=url,
+                        package_id=package_id,
+                    )
+                )
             # if active_mods_json[uuid]["data_source"] == "expansion" or (
             #     active_mods_json[uuid]["data_source"] == "local"
             #     and not active_mods_json[uuid].get("steamcmd")
             # ):
             else:
-                if self.metadata_manager.internal_local_metadata[uuid].get("url"):
-                    url = self.metadata_manager.internal_local_metadata[uuid]["url"]
-                elif self.metadata_manager.internal_local_metadata[uuid].get(
-                    "steam_url"
-                ):
-                    url = self.metadata_manager.internal_local_metadata[uuid][
-                        "steam_url"
-                    ]
-                else:
-                    url = None
-                if url is None:
-                    active_mods_rentry_report = (
-                        active_mods_rentry_report
-                        + f"\n!!! warning {str(count) + '.'} {name} "
-                        + "{"
-                        + f"packageid: {package_id}"
-                        + "} "
-                    )
-                else:
-                    active_mods_rentry_report = (
-                        active_mods_rentry_report
-                        + f"\n!!! warning {str(count) + '.'} [{name}]({url}) "
-                        + "{"
-                        + f"packageid: {package_id}"
-                        + "} "
+                url = md.get("url") or md.get("steam_url")
+                template = _RENTRY_LOCAL_URL_TPL if url else _RENTRY_LOCAL_TPL
+                parts.append(
+                    template.format(
+                        count=count, name=name, url=url, package_id=package_id
                     )
+                )
+        active_mods_rentry_report = "".join(parts)
         # Upload the report to Rentry.co
         rentry_uploader = RentryUpload(active_mods_rentry_report)
-        successful = rentry_uploader.upload_success
-        host = urlparse(rentry_uploader.url).hostname if successful else None
-        if rentry_uploader.url and host and host.endswith("rentry.co"):  # type: ignore
-            copy_to_clipboard_safely(rentry_uploader.url)
+        rentry_url = rentry_uploader.url or ""
+        # Only trust links that point at rentry.co itself
+        successful = rentry_uploader.upload_success and rentry_url.startswith(
+            ("https://rentry.co/", "http://rentry.co/")
+        )
+        if successful:
+            copy_to_clipboard_safely(rentry_url)
             dialogue.show_information(
                 title="Uploaded active mod list",
-                text=f"Uploaded active mod list report to Rentry.co! The URL has been copied to your clipboard:\n\n{rentry_uploader.url}",
+                text=f"Uploaded active mod list report to Rentry.co! The URL has been copied to your clipboard:\n\n{rentry_url}",
                 information='Click "Show Details" to see the full report!',
                 details=f"{active_mods_rentry_report}",
             )
@@ -1617,6 +1927,35 @@ class MainContent(QObject):
                 text="Failed to upload exported active mod list to Rentry.co",
             )
 
+    def _load_preview_url_cache(self) -> dict[str, tuple[float, str]]:
+        """
+        Return the pfid -> (fetched timestamp, preview url) cache, reading it
+        from disk on first use.
+        """
+        if self._preview_url_cache is None:
+            self._preview_url_cache = {}
+            cache_path = AppInfo().app_storage_folder / "preview_url_cache.json"
+            if cache_path.exists():
+                try:
+                    self._preview_url_cache = {
+                        pfid: (float(fetched), url)
+                        for pfid, (fetched, url) in _json_loads(
+                            cache_path.read_bytes()
+                        ).items()
+                    }
+                except (OSError, ValueError, msgspec.DecodeError) as e:
+                    logger.debug(f"Ignoring unreadable preview url cache: {e}")
+        return self._preview_url_cache
+
+    def _save_preview_url_cache(self) -> None:
+        if self._preview_url_cache is None:
+            return
+        cache_path = AppInfo().app_storage_folder / "preview_url_cache.json"
+        try:
+            cache_path.write_bytes(_json_dumps(self._preview_url_cache))
+        except OSError as e:
+            logger.debug(f"Unable to write preview url cache: {e}")
+
     def _do_open_app_directory(self) -> None:
         app_directory = os.getcwd()
         logger.info(f"Opening app directory: {app_directory}")
@@ -1664,29 +2003,13 @@ class MainContent(QObject):
 
     @Slot()
     def _on_do_upload_rimworld_log(self) -> None:
-        player_log_path = (
-            Path(
-                self.settings_controller.settings.instances[
-                    self.settings_controller.settings.current_instance
-                ].config_folder
-            ).parent
-            / "Player.log"
-        )
-
-        self._upload_log(player_log_path)
+        self._upload_log(self.settings_controller.player_log_path)
 
     def _upload_log(self, path: Path) -> None:
-        if not os.path.exists(path):
-            dialogue.show_warning(
-                title="File not found",
-                text="The file you are trying to upload does not exist.",
-                information=f"File: {path}",
-            )
-            return
-
+        # A missing file is reported back by the upload itself
         success, ret = self.do_threaded_loading_animation(
             gif_path=str(AppInfo().theme_data_folder / "default-icons" / "rimsort.gif"),
-            target=partial(upload_data_to_0x0_st, str(path)),
+            target=partial(upload_data_to_0x0_st, path),
             text=f"Uploading {path.name} to 0x0.st...",
         )
 
@@ -1711,28 +2034,25 @@ class MainContent(QObject):
         """
         logger.info("Saving current active mods to ModsConfig.xml")
         active_mods = []
+        # Mirror of active_mods for O(1) duplicate checks
+        seen: set[str] = set()
+        local_md = self.metadata_manager.internal_local_metadata
+        uuid_to_packageid = self.metadata_manager.uuid_to_packageid
         for uuid in self.mods_panel.active_mods_list.uuids:
-            package_id = self.metadata_manager.internal_local_metadata[uuid][
-                "packageid"
-            ]
-            if package_id in active_mods:  # This should NOT be happening
+            package_id = uuid_to_packageid[uuid]
+            if package_id in seen:  # This should NOT be happening
                 logger.critical(
                     f"Tried to export more than 1 identical package ids to the same mod list. Skipping duplicate {package_id}"
                 )
                 continue
             else:  # Otherwise, proceed with adding the mod package_id
-                if (
-                    package_id in self.duplicate_mods.keys()
-                ):  # Check if mod has duplicates
-                    if (
-                        self.metadata_manager.internal_local_metadata[uuid][
-                            "data_source"
-                        ]
-                        == "workshop"
-                    ):
+                if package_id in self.duplicate_mods:  # Check if mod has duplicates
+                    if local_md[uuid]["data_source"] == "workshop":
                         active_mods.append(package_id + "_steam")
+                        seen.add(package_id + "_steam")
                         continue  # Append `_steam` suffix if Steam mod, continue to next mod
                 active_mods.append(package_id)
+                seen.add(package_id)
         logger.info(f"Collected {len(active_mods)} active mods for saving")
 
         mods_config_data = generate_rimworld_mods_list(
@@ -1746,17 +2066,20 @@ class MainContent(QObject):
             )
             / "ModsConfig.xml"
         )
-        try:
-            json_to_xml_write(mods_config_data, mods_config_path)
-        except Exception:
+        # Serialize and write off the UI thread; the write itself is atomic
+        saved = self.do_threaded_loading_animation(
+            gif_path=str(AppInfo().theme_data_folder / "default-icons" / "rimsort.gif"),
+            target=partial(json_to_xml_write, mods_config_data, mods_config_path),
+            text="Saving active mods...",
+        )
+        if not saved:
             logger.error("Could not save active mods")
             dialogue.show_fatal_error(
                 title="Could not save active mods",
                 text="Failed to save active mods to file:",
                 information=f"{mods_config_path}",
-                details=traceback.format_exc(),
             )
-        EventBus().do_save_button_animation_stop.emit()
+        _BUS.do_save_button_animation_stop.emit()
         logger.info("Finished saving active mods")
 
     def _do_restore(self) -> None:
@@ -1769,16 +2092,7 @@ class MainContent(QObject):
             self.active_mods_uuids_restore_state
             and self.inactive_mods_uuids_restore_state
         ):
-            self.mods_panel.signal_clear_search("Active")
-            self.mods_panel.active_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.on_active_mods_search_data_source_filter()
-            self.mods_panel.signal_clear_search("Inactive")
-            self.mods_panel.inactive_mods_filter_data_source_index = len(
-                self.mods_panel.data_source_filter_icons
-            )
-            self.mods_panel.on_inactive_mods_search_data_source_filter()
+            self.mods_panel.reset_both_filters_to_all()
             logger.info(
                 f"Restoring cached mod lists with active list [{len(self.active_mods_uuids_restore_state)}] and inactive list [{len(self.inactive_mods_uuids_restore_state)}]"
             )
@@ -1798,6 +2112,8 @@ class MainContent(QObject):
 
     # TODDS ACTIONS
     def _do_optimize_textures(self, todds_txt_path: str) -> None:
+        from app.utils.todds.wrapper import ToddsInterface
+
         # Setup environment
         todds_interface = ToddsInterface(
             preset=self.settings_controller.settings.todds_preset,
@@ -1815,6 +2131,8 @@ class MainContent(QObject):
         todds_interface.execute_todds_cmd(todds_txt_path, self.todds_runner)
 
     def _do_delete_dds_textures(self, todds_txt_path: str) -> None:
+        from app.utils.todds.wrapper import ToddsInterface
+
         todds_interface = ToddsInterface(
             preset="clean",
             dry_run=self.settings_controller.settings.todds_dry_run,
@@ -1833,6 +2151,9 @@ class MainContent(QObject):
     # STEAM{CMD, WORKS} ACTIONS
 
     def _do_browse_workshop(self) -> None:
+        # Qt WebEngine is only loaded once the workshop browser is first opened
+        from app.utils.steam.browser import SteamBrowser
+
         self.steam_browser = SteamBrowser(
             "https://steamcommunity.com/app/294100/workshop/"
         )
@@ -1853,6 +2174,7 @@ class MainContent(QObject):
             target=partial(
                 metadata.query_workshop_update_data,
                 mods=self.metadata_manager.internal_local_metadata,
+                session=_HTTP_SESSION,
             ),
             text="Checking Steam Workshop mods for updates...",
         )
@@ -1864,6 +2186,8 @@ class MainContent(QObject):
                 information="Are you connected to the Internet?",
             )
             return
+        from app.windows.workshop_mod_updater_panel import ModUpdaterPrompt
+
         workshop_mod_updater = ModUpdaterPrompt(
             internal_mod_metadata=self.metadata_manager.internal_local_metadata
         )
@@ -2025,29 +2349,7 @@ class MainContent(QObject):
                         f"Creating Steamworks API process with instruction {instruction}"
                     )
                     self.steamworks_in_use = True
-                    # Maximum processes
-                    num_processes = cpu_count()
-                    # Chunk the publishedfileids
-                    pfids_chunked = list(
-                        chunks(
-                            _list=instruction[1],
-                            limit=ceil(len(instruction[1]) / num_processes),
-                        )
-                    )
-                    # Create a pool of worker processes
-                    with Pool(processes=num_processes) as pool:
-                        # Create instances of SteamworksSubscriptionHandler for each chunk
-                        actions = [
-                            SteamworksSubscriptionHandler(
-                                action=instruction[0],
-                                pfid_or_pfids=chunk,
-                                interval=1,
-                                _libs=str((AppInfo().application_folder / "libs")),
-                            )
-                            for chunk in pfids_chunked
-                        ]
-                        # Map the execution of the subscription actions to the pool of processes
-                        pool.map(SteamworksSubscriptionHandler.run, actions)
+                    self._run_steamworks_subscription(instruction)
                     self.steamworks_in_use = False
                 else:
                     logger.warning(
@@ -2061,6 +2363,70 @@ class MainContent(QObject):
                 "Steamworks API is already initialized! We do NOT want multiple interactions. Skipping instruction..."
             )
 
+    def _run_steamworks_subscription(self, instruction: list[Any]) -> None:
+        # Reuse the worker pool across calls
+        pool = self._get_steamworks_pool()
+        # Split the publishedfileids evenly across the pool, without empty chunks
+        pfids_chunked = even_chunks(
+            _list=instruction[1],
+            num_chunks=min(_STEAMWORKS_POOL_SIZE, len(instruction[1])),
+        )
+        # Create instances of SteamworksSubscriptionHandler for each chunk
+        libs_path = str((AppInfo().application_folder / "libs"))
+        actions = [
+            SteamworksSubscriptionHandler(
+                action=instruction[0],
+                pfid_or_pfids=chunk,
+                interval=1,
+                _libs=libs_path,
+            )
+            for chunk in pfids_chunked
+        ]
+        if len(actions) == 1:
+            # A single chunk goes straight to one warm worker. It still runs
+            # out of process: the Steamworks API must not be loaded here.
+            pool.apply(SteamworksSubscriptionHandler.run, (actions[0],))
+        else:
+            # Map the execution of the subscription actions to the pool of processes.
+            # There is at most one action per worker, and a worker must not run
+            # a second handler (see _get_steamworks_pool), so keep chunksize at 1.
+            pool.map_async(
+                SteamworksSubscriptionHandler.run, actions, chunksize=1
+            ).get()
+
+    def _get_steamworks_pool(self) -> "Pool":
+        """
+        Return the Steamworks worker pool, creating it on first use.
+
+        Workers are replaced after every task: the Steamworks API is initialized
+        and unloaded per process, so each handler gets a fresh worker. The pool
+        starts replacements in the background, so later calls do not wait on
+        process creation.
+
+        This has to be a process pool. SteamAPI_Init/SteamAPI_Shutdown act on
+        process-global state in the loaded library, so handlers on threads would
+        share and tear down one API instance.
+        """
+        if self._steamworks_pool is None:
+            from multiprocessing import Pool
+
+            # A few workers, each replaced after a single task. Each worker
+            # loads SteamworksPy as it starts, ahead of its task.
+            self._steamworks_pool = Pool(
+                processes=_STEAMWORKS_POOL_SIZE,
+                maxtasksperchild=1,
+                initializer=preload_steamworks,
+                initargs=(str((AppInfo().application_folder / "libs")),),
+            )
+            atexit.register(self._close_steamworks_pool)
+        return self._steamworks_pool
+
+    def _close_steamworks_pool(self) -> None:
+        if self._steamworks_pool is not None:
+            self._steamworks_pool.close()
+            self._steamworks_pool.join()
+            self._steamworks_pool = None
+
     def _do_steamworks_api_call_animated(
         self, instruction: list[list[str] | str]
     ) -> None:
@@ -2149,78 +2515,134 @@ class MainContent(QObject):
 
     def _do_cleanup_gitpython(self, repo: "Repo") -> None:
         # Cleanup GitPython
-        collect()
         repo.git.clear_cache()
         del repo
+        # Windows keeps the pack files locked until the Repo is collected. Elsewhere
+        # clear_cache() already ends the git processes, so skip the collection.
+        if SystemInfo().operating_system == SystemInfo.OperatingSystem.WINDOWS:
+            gc.collect()
 
-    def _check_git_repos_for_update(self, repo_paths: list[str]) -> None:
+    def _check_single_repo(self, repo_path: str, force: bool = False) -> dict[str, Any]:
+        """
+        Fetch a single git repo and force it up to date with its remote.
+
+        Runs on a worker thread, so nothing here touches the UI. Returns an empty
+        dict when the repo is missing or already up-to-date, the update summary
+        when it was updated, or an "error" entry when a git command failed.
+        Unless force is set, the fetch is skipped if the repo was fetched recently.
+        """
+        Repo, GitCommandError = _load_git()
+        logger.info(f"Checking git repository for updates at: {repo_path}")
+        if not os.path.exists(repo_path):
+            return {}
+        repo = Repo(repo_path)
+        try:
+            # Fetch the latest changes from the remote, unless that was just done
+            origin = repo.remote(name="origin")
+            last_fetch = self._repo_last_fetch.get(repo_path)
+            if (
+                force
+                or last_fetch is None
+                or time.monotonic() - last_fetch >= _GIT_FETCH_MIN_INTERVAL
+            ):
+                origin.fetch()
+                self._repo_last_fetch[repo_path] = time.monotonic()
+            else:
+                logger.debug(f"Skipping fetch, {repo_path} was fetched recently")
+
+            # Get the local and remote refs
+            local_ref = repo.head.reference
+            refs = repo.refs()
+            remote_ref = refs[f"origin/{local_ref.name}"]
+
+            # Check if the local branch is behind the remote branch
+            if local_ref.commit != remote_ref.commit:
+                local_name = local_ref.name
+                remote_name = remote_ref.name
+                logger.info(
+                    f"Local branch {local_name} is not up-to-date with remote branch {remote_name}. Updating forcefully."
+                )
+                # Create a summary of the changes that will be made for the repo to be updated
+                summary = {"HEAD~1": local_ref.commit.hexsha[:7]}
+                # Force the branch onto the fetched remote commit. The fetch above
+                # already has the objects, so a pull would only fetch again.
+                repo.git.reset("--hard", remote_ref.name)
+                repo.git.clean("-fdx")  # Remove untracked files
+                summary.update(
+                    {
+                        "HEAD": remote_ref.commit.hexsha[:7],
+                        "message": remote_ref.commit.message,
+                    }
+                )
+                return summary
+            logger.info("The local repository is already up-to-date.")
+            return {}
+        except GitCommandError:
+            return {
+                "error": traceback.format_exc(),
+                "url": (
+                    repo.remotes.origin.url
+                    if repo
+                    and repo.remotes
+                    and repo.remotes.origin
+                    and repo.remotes.origin.url
+                    else None
+                ),
+            }
+        finally:
+            self._do_cleanup_gitpython(repo)
+
+    def _check_repos(
+        self, repo_paths: list[str], force: bool = False
+    ) -> list[tuple[str, dict[str, Any]]]:
+        # Fetches are network bound, so check the repos side by side
+        check = partial(self._check_single_repo, force=force)
+        with ThreadPoolExecutor(max_workers=min(8, len(repo_paths))) as ex:
+            return list(zip(repo_paths, ex.map(check, repo_paths)))
+
+    def _check_git_repos_for_update(
+        self, repo_paths: list[str], force: bool = False
+    ) -> None:
         if GIT_EXISTS:
             # Track summary of repo updates
             updates_summary = {}
-            for repo_path in repo_paths:
-                logger.info(f"Checking git repository for updates at: {repo_path}")
-                if os.path.exists(repo_path):
-                    repo = Repo(repo_path)
-                    try:
-                        # Fetch the latest changes from the remote
-                        origin = repo.remote(name="origin")
-                        origin.fetch()
-
-                        # Get the local and remote refs
-                        local_ref = repo.head.reference
-                        refs = repo.refs()
-                        remote_ref = refs[f"origin/{local_ref.name}"]
-
-                        # Check if the local branch is behind the remote branch
-                        if local_ref.commit != remote_ref.commit:
-                            local_name = local_ref.name
-                            remote_name = remote_ref.name
-                            logger.info(
-                                f"Local branch {local_name} is not up-to-date with remote branch {remote_name}. Updating forcefully."
-                            )
-                            # Create a summary of the changes that will be made for the repo to be updated
-                            updates_summary[repo_path] = {
-                                "HEAD~1": local_ref.commit.hexsha[:7],
-                            }
-                            # Force pull the latest changes
-                            repo.git.reset("--hard", remote_ref.name)
-                            repo.git.clean("-fdx")  # Remove untracked files
-                            origin.pull(local_ref.name, rebase=True)
-                            updates_summary[repo_path].update(
-                                {
-                                    "HEAD": remote_ref.commit.hexsha[:7],
-                                    "message": remote_ref.commit.message,
-                                }
-                            )
-                        else:
-                            logger.info("The local repository is already up-to-date.")
-                    except GitCommandError:
-                        stacktrace = traceback.format_exc()
-                        dialogue.show_warning(
-                            title="Failed to update repo!",
-                            text=f"The repository supplied at [{repo_path}] failed to update!\n"
-                            + "Are you connected to the Internet? "
-                            + "Is the repo valid?",
-                            information=(
-                                f"Supplied repository: {repo.remotes.origin.url}"
-                                if repo
-                                and repo.remotes
-                                and repo.remotes.origin
-                                and repo.remotes.origin.url
-                                else None
-                            ),
-                            details=stacktrace,
-                        )
-                    finally:
-                        self._do_cleanup_gitpython(repo)
+            results = []
+            if repo_paths:
+                # Keep the UI responsive while the repos are fetched
+                results = self.do_threaded_loading_animation(
+                    gif_path=str(
+                        AppInfo().theme_data_folder / "default-icons" / "refresh.gif"
+                    ),
+                    target=partial(self._check_repos, repo_paths, force=force),
+                    text="Checking git repo(s) for updates...",
+                )
+                if results is None:
+                    logger.error("Checking git repos for updates failed unexpectedly")
+                    results = []
+            for repo_path, result in results:
+                if "error" in result:
+                    dialogue.show_warning(
+                        title="Failed to update repo!",
+                        text=f"The repository supplied at [{repo_path}] failed to update!\n"
+                        + "Are you connected to the Internet? "
+                        + "Is the repo valid?",
+                        information=(
+                            f"Supplied repository: {result['url']}"
+                            if result["url"]
+                            else None
+                        ),
+                        details=result["error"],
+                    )
+                elif result:
+                    updates_summary[repo_path] = result
             # If any updates were found, notify the user
             if updates_summary:
-                repos_updated = "\n".join(
-                    list(os.path.split(k)[1] for k in updates_summary.keys())
-                )
+                # Folder name of each updated repo, split from its path once
+                repo_names = {k: Path(k).name for k in updates_summary}
+                repos_updated = "\n".join(repo_names.values())
                 updates_summarized = "\n".join(
                     [
-                        f"[{os.path.split(k)[1]}]: {v['HEAD~1']  + '...' + v['HEAD']}\n"
+                        f"[{repo_names[k]}]: {v['HEAD~1'] + '...' + v['HEAD']}\n"
                         + f"{v['message']}\n"
                         for k, v in updates_summary.items()
                     ]
@@ -2239,25 +2661,26 @@ class MainContent(QObject):
         else:
             self._do_notify_no_git()
 
-    def _do_clone_repo_to_path(self, base_path: str, repo_url: str) -> None:
+    def _do_clone_repo_to_path(
+        self, base_path: str, repo_url: str, shallow: bool = False
+    ) -> None:
         """
         Checks validity of configured git repo, as well as if it exists
         Handles possible existing repo, and prompts (re)download of repo
         Otherwise it just clones the repo and notifies user
+
+        Pass shallow=True for database repos, where only the tip is used.
+        Mod repos are cloned with their full history.
         """
         # Check if git is installed
         if not GIT_EXISTS:
             self._do_notify_no_git()
             return
+        Repo, GitCommandError = _load_git()
 
-        if (
-            repo_url
-            and repo_url != ""
-            and repo_url.startswith("http://")
-            or repo_url.startswith("https://")
-        ):
+        if _REPO_URL_RE.match(repo_url or ""):
             # Calculate folder name from provided URL
-            repo_folder_name = os.path.split(repo_url)[1]
+            _, repo_folder_name = _split_repo_url(repo_url)
             # Calculate path from generated folder name
             repo_path = str((Path(base_path) / repo_folder_name))
             if os.path.exists(repo_path):  # If local repo does exist
@@ -2286,13 +2709,19 @@ class MainContent(QObject):
                     delete_files_except_extension(directory=repo_path, extension=".dds")
                 elif answer == "Update existing":
                     self._do_force_update_existing_repo(
-                        base_path=base_path, repo_url=repo_url
+                        base_path=base_path, repo_url=repo_url, shallow=shallow
                     )
                     return
             # Clone the repo to storage path and notify user
             logger.info(f"Cloning {repo_url} to: {repo_path}")
             try:
-                Repo.clone_from(repo_url, repo_path)
+                if shallow:
+                    # Only the tip is used, so skip the history (no local git log)
+                    Repo.clone_from(
+                        repo_url, repo_path, depth=1, single_branch=True, no_tags=True
+                    )
+                else:
+                    Repo.clone_from(repo_url, repo_path)
                 dialogue.show_information(
                     title="Repo retrieved",
                     text="The configured repository was cloned!",
@@ -2346,20 +2775,18 @@ class MainContent(QObject):
                 + 'empty and is prefixed with "http://" or "https://"',
             )
 
-    def _do_force_update_existing_repo(self, base_path: str, repo_url: str) -> None:
+    def _do_force_update_existing_repo(
+        self, base_path: str, repo_url: str, shallow: bool = False
+    ) -> None:
         """
         Checks validity of configured git repo, as well as if it exists
         Handles possible existing repo, and prompts (re)download of repo
         Otherwise it just clones the repo and notifies user
         """
-        if (
-            repo_url
-            and repo_url != ""
-            and repo_url.startswith("http://")
-            or repo_url.startswith("https://")
-        ):
+        Repo, GitCommandError = _load_git()
+        if _REPO_URL_RE.match(repo_url or ""):
             # Calculate folder name from provided URL
-            repo_folder_name = os.path.split(repo_url)[1]
+            _, repo_folder_name = _split_repo_url(repo_url)
             # Calculate path from generated folder name
             repo_path = str((Path(base_path) / repo_folder_name))
             if os.path.exists(repo_path):  # If local repo does exists
@@ -2415,6 +2842,7 @@ class MainContent(QObject):
                         self._do_clone_repo_to_path(
                             base_path=base_path,
                             repo_url=repo_url,
+                            shallow=shallow,
                         )
                     else:
                         self._do_notify_no_git()
@@ -2428,43 +2856,50 @@ class MainContent(QObject):
                 + 'empty and is prefixed with "http://" or "https://"',
             )
 
-    def _do_upload_db_to_repo(self, repo_url: str, file_name: str) -> None:
+    def _do_upload_db_to_repo(self, repo_url: str, file_names: list[str]) -> None:
         """
         Checks validity of configured git repo, as well as if it exists
-        Commits file & submits PR based on version tag found in DB
+        Commits files & submits PR based on version tag found in the first file (the DB)
         """
-        if (
-            repo_url
-            and repo_url != ""
-            and (repo_url.startswith("http://") or repo_url.startswith("https://"))
-        ):
+        Repo, _ = _load_git()
+        if _REPO_URL_RE.match(repo_url or ""):
             # Calculate folder name from provided URL
-            repo_user_or_org = os.path.split(os.path.split(repo_url)[0])[1]
-            repo_folder_name = os.path.split(repo_url)[1]
+            repo_user_or_org, repo_folder_name = _split_repo_url(repo_url)
             # Calculate path from generated folder name
             repo_path = str((AppInfo().databases_folder / repo_folder_name))
             if os.path.exists(repo_path):  # If local repo exists
                 # Update the file, commit + PR to repo
                 logger.info(
-                    f"Attempting to commit changes to {file_name} in git repository: {repo_path}"
+                    f"Attempting to commit changes to {file_names} in git repository: {repo_path}"
                 )
                 try:
-                    # Specify the file path relative to the local repository
-                    file_full_path = str((Path(repo_path) / file_name))
-                    if os.path.exists(file_full_path):
-                        # Load JSON data
-                        with open(file_full_path, encoding="utf-8") as f:
-                            json_string = f.read()
+                    # Specify the file paths relative to the local repository
+                    file_full_paths = [
+                        str((Path(repo_path) / file_name)) for file_name in file_names
+                    ]
+                    file_full_path = file_full_paths[0]
+                    missing_paths = [
+                        path for path in file_full_paths if not os.path.exists(path)
+                    ]
+                    if not missing_paths:
+                        # Load JSON data straight from a read-only mapping of the
+                        # file, instead of first copying it into a bytes object
+                        with (
+                            open(file_full_path, "rb") as f,
+                            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                            memoryview(mm) as view,
+                        ):
                             logger.debug("Reading info...")
-                            database = json.loads(json_string)
-                            logger.debug("Retrieved database...")
-                        if database.get("version"):
+                            # Only the version fields are needed, not the database
+                            stamp = msgspec.json.decode(view, type=_DatabaseStamp)
+                            logger.debug("Retrieved database version...")
+                        if stamp.version:
                             database_version = (
-                                database["version"]
+                                stamp.version
                                 - self.settings_controller.settings.database_expiry
                             )
-                        elif database.get("timestamp"):
-                            database_version = database["timestamp"]
+                        elif stamp.timestamp:
+                            database_version = stamp.timestamp
                         else:
                             logger.error(
                                 "Unable to parse version or timestamp from database. Cancelling upload."
@@ -2485,18 +2920,16 @@ class MainContent(QObject):
                         dialogue.show_warning(
                             title="File does not exist",
                             text="Please ensure the file exists and then try to upload again!",
-                            information=f"File not found:\n{file_full_path}\nRepository:\n{repo_url}",
+                            information="File not found:\n"
+                            + "\n".join(missing_paths)
+                            + f"\nRepository:\n{repo_url}",
                         )
                         return
 
-                    # Create a GitHub instance
-                    g = Github(
-                        self.settings_controller.settings.github_username,
-                        self.settings_controller.settings.github_token,
-                    )
-
                     # Specify the repository
-                    repo = g.get_repo(f"{repo_user_or_org}/{repo_folder_name}")
+                    repo = self._get_github_repo(
+                        f"{repo_user_or_org}/{repo_folder_name}"
+                    )
 
                     # Specify the branch names
                     base_branch = "main"
@@ -2516,8 +2949,8 @@ class MainContent(QObject):
                     new_branch = local_repo.create_head(new_branch_name)
                     local_repo.head.set_reference(ref=new_branch)
 
-                    # Add the file to the index on our new branch
-                    local_repo.index.add([file_full_path])
+                    # Stage every file on our new branch in a single index update
+                    local_repo.index.add(file_full_paths)
 
                     # Commit changes to the new branch
                     local_repo.index.commit(commit_message)
@@ -2569,7 +3002,8 @@ class MainContent(QObject):
                     stacktrace = traceback.format_exc()
                     dialogue.show_warning(
                         title="Failed to update repo!",
-                        text=f"The configured repo failed to update!\nFile name: {file_name}",
+                        text="The configured repo failed to update!\nFile name(s): "
+                        + ", ".join(file_names),
                         information=f"Configured repository: {repo_url}",
                         details=stacktrace,
                     )
@@ -2584,6 +3018,7 @@ class MainContent(QObject):
                         self._do_clone_repo_to_path(
                             base_path=str(AppInfo().databases_folder),
                             repo_url=repo_url,
+                            shallow=True,
                         )
                     else:
                         self._do_notify_no_git()
@@ -2596,6 +3031,25 @@ class MainContent(QObject):
                 + 'A valid repository is a repository URL which is not empty and is prefixed with "http://" or "https://"',
             )
 
+    def _get_github_repo(self, full_name: str) -> "Repository":
+        """
+        Return a GitHub repository, reusing the client and earlier lookups.
+
+        Both are rebuilt when the configured username or token changes.
+        """
+        auth = (
+            self.settings_controller.settings.github_username,
+            self.settings_controller.settings.github_token,
+        )
+        if self._github_client is None or self._github_client[0] != auth:
+            self._github_client = (auth, _github()(*auth))
+            self._github_repo_cache.clear()
+        repo = self._github_repo_cache.get(full_name)
+        if repo is None:
+            repo = self._github_client[1].get_repo(full_name)
+            self._github_repo_cache[full_name] = repo
+        return repo
+
     def _do_notify_no_git(self) -> None:
         answer = dialogue.show_dialogue_conditional(  # We import last so we can use gui + utils
             title="git not found",
@@ -2730,23 +3184,41 @@ class MainContent(QObject):
                     mods=self.metadata_manager.internal_local_metadata,
                     update=self.settings_controller.settings.build_steam_database_update_toggle,
                 )
-            # Create query runner
-            self.query_runner = RunnerPanel()
-            self.query_runner.closing_signal.connect(self.db_builder.terminate)
-            self.query_runner.setWindowTitle(
+            self._do_show_query_runner(
                 f"RimSort - DB Builder ({self.settings_controller.settings.db_builder_include})"
             )
-            self.query_runner.progress_bar.show()
-            self.query_runner.show()
-            # Connect message signal
-            self.db_builder.db_builder_message_output_signal.connect(
-                self.query_runner.message
-            )
             # Start DB builder
             self.db_builder.start()
         else:
             logger.debug("USER ACTION: cancelled selection...")
 
+    def _do_show_query_runner(self, title: str) -> None:
+        """
+        Show the DB Builder query runner for the current self.db_builder
+
+        The panel is created once and reset between runs, rather than
+        building a new widget for every DB Builder action.
+
+        :param title: window title for this run
+        """
+        if self.query_runner is None:
+            self.query_runner = RunnerPanel()
+            self.query_runner.closing_signal.connect(self._do_terminate_db_builder)
+        else:
+            self.query_runner.reset()
+        self.query_runner.setWindowTitle(title)
+        self.query_runner.progress_bar.show()
+        self.query_runner.show()
+        # Connect message signal
+        self.db_builder.db_builder_message_output_signal.connect(
+            self.query_runner.queue_message
+        )
+
+    def _do_terminate_db_builder(self) -> None:
+        db_builder = getattr(self, "db_builder", None)
+        if db_builder is not None and db_builder.isRunning():
+            db_builder.terminate()
+
     def _do_blacklist_action_steamdb(self, instruction: list[Any]) -> None:
         if (
             self.metadata_manager.external_steam_metadata_path
@@ -2761,6 +3233,9 @@ class MainContent(QObject):
                 comment = instruction[2]
             else:
                 comment = None
+            previous_blacklist = self.metadata_manager.external_steam_metadata.get(
+                publishedfileid, {}
+            ).get("blacklist")
             # Check if our DB has an entry for the mod we are editing
             if not self.metadata_manager.external_steam_metadata.get(publishedfileid):
                 self.metadata_manager.external_steam_metadata.setdefault(
@@ -2778,13 +3253,20 @@ class MainContent(QObject):
                 self.metadata_manager.external_steam_metadata[publishedfileid].pop(
                     "blacklist", None
                 )
+            # Don't rewrite the whole database for an edit that changes nothing
+            if (
+                self.metadata_manager.external_steam_metadata[publishedfileid].get(
+                    "blacklist"
+                )
+                == previous_blacklist
+            ):
+                logger.debug("SteamDB blacklist status unchanged, skipping save")
+                return
             logger.debug("Updating previous database with new metadata...\n")
-            with open(
-                self.metadata_manager.external_steam_metadata_path,
-                "w",
-                encoding="utf-8",
-            ) as output:
-                json.dump(
+            saved = self._do_database_io(
+                partial(
+                    _dump_json,
+                    self.metadata_manager.external_steam_metadata_path,
                     {
                         "version": int(
                             time.time()
@@ -2792,11 +3274,67 @@ class MainContent(QObject):
                         ),
                         "database": self.metadata_manager.external_steam_metadata,
                     },
-                    output,
-                    indent=4,
-                )
+                ),
+                text="Saving SteamDB...",
+            )
+            if not saved:
+                self._do_notify_database_io_failed("save the SteamDB")
             self._do_refresh()
 
+    def _do_prompt_database_inputs(self) -> list[str] | None:
+        """
+        Prompt for the paths of input databases A and B
+
+        :return: the two paths, or None if either selection was cancelled
+        """
+        input_paths = []
+        for label, caption in (
+            ("A", 'Input "to-be-updated" database, input A'),
+            ("B", "Input update source database, input B"),
+        ):
+            logger.info(f"Opening file dialog to specify input file {label}")
+            input_path = dialogue.show_dialogue_file(
+                mode="open",
+                caption=caption,
+                _dir=str(AppInfo().app_storage_folder),
+                _filter="JSON (*.json)",
+            )
+            logger.info(f"Selected path: {input_path}")
+            if not input_path or not os.path.exists(input_path):
+                logger.warning("Steam DB Builder: User cancelled selection...")
+                return None
+            input_paths.append(input_path)
+        return input_paths
+
+    def _do_database_io(self, target: Callable[[], Any], text: str) -> Any:
+        """
+        Run a database read or write on a worker thread behind the loading animation
+
+        :param target: callable doing the I/O
+        :param text: message shown under the animation
+        :return: the target's return value, or None if it raised
+        """
+        # The animation swallows exceptions and hands back {} on failure, which
+        # can't be told apart from an empty result. Capture the return value here.
+        result: list[Any] = []
+
+        def run() -> None:
+            result.append(target())
+
+        self.do_threaded_loading_animation(
+            gif_path=str(AppInfo().theme_data_folder / "default-icons" / "rimsort.gif"),
+            target=run,
+            text=text,
+        )
+        return result[0] if result else None
+
+    def _do_notify_database_io_failed(self, action: str) -> None:
+        dialogue.show_warning(
+            title="Steam DB Builder",
+            text=f"Failed to {action}!",
+            information="Please check the log for details.",
+        )
+
     def _do_download_entire_workshop(self, action: str) -> None:
         # DB Builder is used to run DQ and grab entirety of
         # any available Steam Workshop PublishedFileIDs
@@ -2806,21 +3344,15 @@ class MainContent(QObject):
             database_expiry=self.settings_controller.settings.database_expiry,
             mode="pfids_by_appid",
         )
-        # Create query runner
-        self.query_runner = RunnerPanel()
-        self.query_runner.closing_signal.connect(self.db_builder.terminate)
-        self.query_runner.setWindowTitle("RimSort - DB Builder PublishedFileIDs query")
-        self.query_runner.progress_bar.show()
-        self.query_runner.show()
-        # Connect message signal
-        self.db_builder.db_builder_message_output_signal.connect(
-            self.query_runner.message
+        self._do_show_query_runner("RimSort - DB Builder PublishedFileIDs query")
+        # Continue once the query finishes, without blocking in a nested event loop
+        self.db_builder.finished.connect(
+            partial(self._do_download_entire_workshop_finish, action)
         )
         # Start DB builder
         self.db_builder.start()
-        loop = QEventLoop()
-        self.db_builder.finished.connect(loop.quit)
-        loop.exec_()
+
+    def _do_download_entire_workshop_finish(self, action: str) -> None:
         if not len(self.db_builder.publishedfileids) > 0:
             dialogue.show_warning(
                 title="No PublishedFileIDs",
@@ -2829,21 +3361,17 @@ class MainContent(QObject):
                 + "PublishedFileIDs are needed to retrieve mods from Steam!",
             )
         else:
-            self.query_runner.close()
-            self.query_runner = None
+            if self.query_runner is not None:
+                self.query_runner.close()
             if "steamcmd" in action:
                 # Filter out existing SteamCMD mods
-                mod_pfid = None
-                for (
-                    metadata_values
-                ) in self.metadata_manager.internal_local_metadata.values():
-                    if metadata_values.get("steamcmd"):
-                        mod_pfid = metadata_values.get("publishedfileid")
-                    if mod_pfid and mod_pfid in self.db_builder.publishedfileids:
-                        logger.debug(
-                            f"Skipping download of existing SteamCMD mod: {mod_pfid}"
-                        )
-                        self.db_builder.publishedfileids.remove(mod_pfid)
+                existing_pfids = {
+                    metadata_values["publishedfileid"]
+                    for metadata_values in self.metadata_manager.internal_local_metadata.values()
+                    if metadata_values.get("steamcmd")
+                    and metadata_values.get("publishedfileid")
+                }
+                self._do_skip_existing_pfids(existing_pfids, "SteamCMD")
                 self._do_download_mods_with_steamcmd(self.db_builder.publishedfileids)
             elif "steamworks" in action:
                 answer = dialogue.show_dialogue_conditional(
@@ -2856,29 +3384,38 @@ class MainContent(QObject):
                     + "a separate, authenticated instance of SteamCMD, if you do not want to anonymously download via RimSort.",
                 )
                 if answer == "&Yes":
-                    for (
-                        metadata_values
-                    ) in self.metadata_manager.internal_local_metadata.values():
-                        mod_pfid = metadata_values.get("publishedfileid")
-                        if (
-                            metadata_values["data_source"] == "workshop"
-                            and mod_pfid
-                            and mod_pfid in self.db_builder.publishedfileids
-                        ):
-                            logger.warning(
-                                f"Skipping download of existing Steam mod: {mod_pfid}"
-                            )
-                            self.db_builder.publishedfileids.remove(mod_pfid)
+                    existing_pfids = {
+                        metadata_values["publishedfileid"]
+                        for metadata_values in self.metadata_manager.internal_local_metadata.values()
+                        if metadata_values["data_source"] == "workshop"
+                        and metadata_values.get("publishedfileid")
+                    }
+                    self._do_skip_existing_pfids(existing_pfids, "Steam")
                     self._do_steamworks_api_call_animated(
                         [
                             "subscribe",
                             [
-                                eval(str_pfid)
+                                int(str_pfid)
                                 for str_pfid in self.db_builder.publishedfileids
                             ],
                         ]
                     )
 
+    def _do_skip_existing_pfids(self, existing_pfids: set[str], source: str) -> None:
+        """
+        Drop already installed mods from the DB Builder's PublishedFileIDs, keeping order
+
+        :param existing_pfids: PublishedFileIDs of the installed mods to skip
+        :param source: name of the mod source, for logging
+        """
+        pfids = self.db_builder.publishedfileids
+        remaining = [pfid for pfid in pfids if pfid not in existing_pfids]
+        if len(remaining) != len(pfids):
+            logger.debug(
+                f"Skipping download of {len(pfids) - len(remaining)} existing {source} mod(s)"
+            )
+        self.db_builder.publishedfileids = remaining
+
     def _do_edit_steam_webapi_key(self) -> None:
         """
         Opens a QDialogInput that allows the user to edit their Steam API-key
@@ -2901,8 +3438,6 @@ class MainContent(QObject):
         """
         # TODO: Refactor this...
         discrepancies: list[str] = []
-        database_a_deps: dict[str, Any] = {}
-        database_b_deps: dict[str, Any] = {}
         # Notify user
         dialogue.show_information(
             title="Steam DB Builder",
@@ -2912,98 +3447,81 @@ class MainContent(QObject):
             + "\n\t1) Select input A"
             + "\n\t2) Select input B",
         )
-        # Input A
-        logger.info("Opening file dialog to specify input file A")
-        input_path_a = dialogue.show_dialogue_file(
-            mode="open",
-            caption='Input "to-be-updated" database, input A',
-            _dir=str(AppInfo().app_storage_folder),
-            _filter="JSON (*.json)",
-        )
-        logger.info(f"Selected path: {input_path_a}")
-        if input_path_a and os.path.exists(input_path_a):
-            with open(input_path_a, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug("Retrieved database A...")
-        else:
-            logger.warning("Steam DB Builder: User cancelled selection...")
+        input_paths = self._do_prompt_database_inputs()
+        if input_paths is None:
             return
-        # Input B
-        logger.info("Opening file dialog to specify input file B")
-        input_path_b = dialogue.show_dialogue_file(
-            mode="open",
-            caption='Input "to-be-updated" database, input A',
-            _dir=str(AppInfo().app_storage_folder),
-            _filter="JSON (*.json)",
+        # Read both databases once both paths are known, off the UI thread
+        db_inputs = self._do_database_io(
+            partial(_load_json_files, input_paths),
+            text="Loading databases A & B...",
         )
-        logger.info(f"Selected path: {input_path_b}")
-        if input_path_b and os.path.exists(input_path_b):
-            with open(input_path_b, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_b = json.loads(json_string)
-                logger.debug("Retrieved database B...")
-        else:
-            logger.debug("Steam DB Builder: User cancelled selection...")
+        if db_inputs is None:
+            self._do_notify_database_io_failed("load the selected databases")
             return
-        for k, v in db_input_a["database"].items():
-            # print(k, v['dependencies'])
-            database_b_deps[k] = set()
-            if v.get("dependencies"):
-                for dep_key in v["dependencies"]:
-                    database_b_deps[k].add(dep_key)
-        for k, v in db_input_b["database"].items():
-            # print(k, v['dependencies'])
-            if k in database_b_deps:
-                database_a_deps[k] = set()
-                if v.get("dependencies"):
-                    for dep_key in v["dependencies"]:
-                        database_a_deps[k].add(dep_key)
+        db_input_a, db_input_b = db_inputs
+        # Dependency sets per mod, in one pass over each database. Equal sets are
+        # interned to one frozenset, so identical deps compare by identity below.
+        interned_deps: dict[frozenset[str], frozenset[str]] = {}
+
+        def intern_deps(deps: Any) -> frozenset[str]:
+            deps_set = frozenset(deps or ())
+            return interned_deps.setdefault(deps_set, deps_set)
+
+        database_b_deps: dict[str, frozenset[str]] = {
+            k: intern_deps(v.get("dependencies"))
+            for k, v in db_input_a["database"].items()
+        }
+        database_a_deps: dict[str, frozenset[str]] = {
+            k: intern_deps(v.get("dependencies"))
+            for k, v in db_input_b["database"].items()
+            if k in database_b_deps
+        }
+        unpublished = {
+            k for k, v in db_input_a["database"].items() if v.get("unpublished")
+        }
         no_deps_str = "*no explicit dependencies listed*"
         database_a_total_deps = len(database_a_deps)
         database_b_total_deps = len(database_b_deps)
-        report = (
-            "\nSteam DB comparison report:\n"
-            + "\nTotal # of deps from database A:\n"
-            + f"{database_a_total_deps}"
-            + "\nTotal # of deps from database B:\n"
-            + f"{database_b_total_deps}"
-            + f"\nTotal # of discrepancies:\n{len(discrepancies)}"
-        )
+        # Discrepancy entries are collected and joined once at the end
+        report_parts: list[str] = []
         comparison_skipped = []
         for k, v in database_b_deps.items():
-            if db_input_a["database"][k].get("unpublished"):
+            if k in unpublished:
                 comparison_skipped.append(k)
                 # logger.debug(f"Skipping comparison for unpublished mod: {k}")
             else:
-                # If the deps are different...
-                if v != database_a_deps.get(k):
-                    pp = database_a_deps.get(k)
-                    if pp:
-                        # Normalize here (get rid of core/dlc deps)
-                        if v != pp:
-                            discrepancies.append(k)
-                            pp_total = len(pp)
-                            v_total = len(v)
-                            if v == set():
-                                v = no_deps_str
-                            if pp == set():
-                                pp = no_deps_str
-                            mod_name = db_input_b["database"][k]["name"]
-                            report += f"\n\nDISCREPANCY FOUND for {k}:"
-                            report += f"\nhttps://steamcommunity.com/sharedfiles/filedetails/?id={k}"
-                            report += f"\nMod name: {mod_name}"
-                            report += (
-                                f"\n\nDatabase A:\n{v_total} dependencies found:\n{v}"
-                            )
-                            report += (
-                                f"\n\nDatabase B:\n{pp_total} dependencies found:\n{pp}"
-                            )
+                pp = database_a_deps.get(k)
+                # If the deps are different (interned, so equal sets are the same object)...
+                if pp and v is not pp:
+                    discrepancies.append(k)
+                    pp_total = len(pp)
+                    v_total = len(v)
+                    # Shown as plain sets in the report
+                    v_shown = set(v) if v else no_deps_str
+                    pp_shown = set(pp)
+                    mod_name = db_input_b["database"][k]["name"]
+                    report_parts.append(
+                        f"\n\nDISCREPANCY FOUND for {k}:"
+                        + f"\nhttps://steamcommunity.com/sharedfiles/filedetails/?id={k}"
+                        + f"\nMod name: {mod_name}"
+                        + f"\n\nDatabase A:\n{v_total} dependencies found:\n{v_shown}"
+                        + f"\n\nDatabase B:\n{pp_total} dependencies found:\n{pp_shown}"
+                    )
         logger.debug(
             f"Comparison skipped for {len(comparison_skipped)} unpublished mods: {comparison_skipped}"
         )
+        # The header is built last so it reports the final discrepancy count
+        report = "".join(
+            [
+                "\nSteam DB comparison report:\n"
+                + "\nTotal # of deps from database A:\n"
+                + f"{database_a_total_deps}"
+                + "\nTotal # of deps from database B:\n"
+                + f"{database_b_total_deps}"
+                + f"\nTotal # of discrepancies:\n{len(discrepancies)}",
+                *report_parts,
+            ]
+        )
         dialogue.show_information(
             title="Steam DB Builder",
             text=f"Steam DB comparison report: {len(discrepancies)} found",
@@ -3025,42 +3543,18 @@ class MainContent(QObject):
             + "\n\t2) Select input B (update source)"
             + "\n\t3) Select output C (resultant db)",
         )
-        # Input A
-        logger.info("Opening file dialog to specify input file A")
-        input_path_a = dialogue.show_dialogue_file(
-            mode="open",
-            caption='Input "to-be-updated" database, input A',
-            _dir=str(AppInfo().app_storage_folder),
-            _filter="JSON (*.json)",
-        )
-        logger.info(f"Selected path: {input_path_a}")
-        if input_path_a and os.path.exists(input_path_a):
-            with open(input_path_a, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug("Retrieved database A...")
-        else:
-            logger.warning("Steam DB Builder: User cancelled selection...")
+        input_paths = self._do_prompt_database_inputs()
+        if input_paths is None:
             return
-        # Input B
-        logger.info("Opening file dialog to specify input file B")
-        input_path_b = dialogue.show_dialogue_file(
-            mode="open",
-            caption='Input "to-be-updated" database, input A',
-            _dir=str(AppInfo().app_storage_folder),
-            _filter="JSON (*.json)",
+        # Read both databases once both paths are known, off the UI thread
+        db_inputs = self._do_database_io(
+            partial(_load_json_files, input_paths),
+            text="Loading databases A & B...",
         )
-        logger.info(f"Selected path: {input_path_b}")
-        if input_path_b and os.path.exists(input_path_b):
-            with open(input_path_b, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_b = json.loads(json_string)
-                logger.debug("Retrieved database B...")
-        else:
-            logger.debug("Steam DB Builder: User cancelled selection...")
+        if db_inputs is None:
+            self._do_notify_database_io_failed("load the selected databases")
             return
+        db_input_a, db_input_b = db_inputs
         # Output C
         db_output_c = db_input_a.copy()
         metadata.recursively_update_dict(
@@ -3070,7 +3564,9 @@ class MainContent(QObject):
             recurse_exceptions=app_constants.DB_BUILDER_RECURSE_EXCEPTIONS,
         )
         logger.info("Updated DB A with DB B!")
-        logger.debug(db_output_c)
+        logger.debug(
+            f"Merged database contains {len(db_output_c.get('database', {}))} entries"
+        )
         logger.info("Opening file dialog to specify output file")
         output_path = dialogue.show_dialogue_file(
             mode="save",
@@ -3082,8 +3578,12 @@ class MainContent(QObject):
         if output_path:
             if not output_path.endswith(".json"):
                 output_path += ".json"  # Handle file extension if needed
-            with open(output_path, "w", encoding="utf-8") as output:
-                json.dump(db_output_c, output, indent=4)
+            saved = self._do_database_io(
+                partial(_dump_json, output_path, db_output_c),
+                text="Saving database C...",
+            )
+            if not saved:
+                self._do_notify_database_io_failed("save the resultant database")
         else:
             logger.warning("Steam DB Builder: User cancelled selection...")
             return
@@ -3107,16 +3607,14 @@ class MainContent(QObject):
             )
             return
         # Retrieve original database
-        try:
-            with open(path, encoding="utf-8") as f:
-                json_string = f.read()
-                logger.debug("Reading info...")
-                db_input_a = json.loads(json_string)
-                logger.debug(
-                    f"Retrieved copy of existing {rules_source} database to update."
-                )
-        except Exception:
+        db_input_a = self._do_database_io(
+            partial(_load_json, path), text=f"Loading {rules_source} database..."
+        )
+        if db_input_a is None:
             logger.error("Failed to read info from existing database")
+            self._do_notify_database_io_failed(f"load the {rules_source} database")
+            return
+        logger.debug(f"Retrieved copy of existing {rules_source} database to update.")
         db_input_b = {"timestamp": int(time.time()), "rules": rules_data}
         db_output_c = db_input_a.copy()
         # Update database in place
@@ -3133,8 +3631,12 @@ class MainContent(QObject):
             information=f"This operation will overwrite the {rules_source} database located at the following path:\n\n{path}",
         )
         if answer == "&Yes":
-            with open(path, "w", encoding="utf-8") as output:
-                json.dump(db_output_c, output, indent=4)
+            saved = self._do_database_io(
+                partial(_dump_json, path, db_output_c),
+                text=f"Saving {rules_source} database...",
+            )
+            if not saved:
+                self._do_notify_database_io_failed(f"save the {rules_source} database")
             self._do_refresh()
         else:
             logger.debug("USER ACTION: declined to continue rules database update.")
@@ -3185,7 +3687,7 @@ class MainContent(QObject):
     def _on_do_upload_community_db_to_github(self) -> None:
         self._do_upload_db_to_repo(
             repo_url=self.settings_controller.settings.external_community_rules_repo,
-            file_name="communityRules.json",
+            file_names=["communityRules.json"],
         )
 
     @Slot()
@@ -3194,6 +3696,7 @@ class MainContent(QObject):
             self._do_clone_repo_to_path(
                 base_path=str(AppInfo().databases_folder),
                 repo_url=self.settings_controller.settings.external_community_rules_repo,
+                shallow=True,
             )
         else:
             self._do_notify_no_git()
@@ -3202,7 +3705,7 @@ class MainContent(QObject):
     def _on_do_upload_steam_workshop_db_to_github(self) -> None:
         self._do_upload_db_to_repo(
             repo_url=self.settings_controller.settings.external_steam_metadata_repo,
-            file_name="steamDB.json",
+            file_names=["steamDB.json"],
         )
 
     @Slot()
@@ -3210,6 +3713,7 @@ class MainContent(QObject):
         self._do_clone_repo_to_path(
             base_path=str(AppInfo().databases_folder),
             repo_url=self.settings_controller.settings.external_steam_metadata_repo,
+            shallow=True,
         )
 
     @Slot()
@@ -3259,3 +3763,26 @@ class MainContent(QObject):
 
         # Launch independent game process without Steamworks API
         launch_game_process(game_install_path=game_install_path, args=run_args)
+
+
+class MissingModsVariantsTask(QRunnable):
+    def __init__(
+        self,
+        parent: MainContent,
+        packageids: list[str],
+        steam_workshop_metadata: dict[str, Any],
+    ):
+        super().__init__()
+        self.parent = parent
+        self.packageids = packageids
+        self.steam_workshop_metadata = steam_workshop_metadata
+
+    @Slot()
+    def run(self) -> None:
+        data_by_variants = build_missing_mods_variants(
+            self.packageids, self.steam_workshop_metadata
+        )
+        # Emit signal on completion, the prompt is built on the UI thread
+        self.parent._missing_mods_variants_signal.emit(
+            self.packageids, data_by_variants
+        )
@@ -1208,7 +1208,7 @@ class ModListWidget(QListWidget):
                         self.steamworks_subscription_signal.emit(
                             [
                                 "重新订阅",
-                                [eval(str_pfid) for str_pfid in publishedfileids],
+                                [int(str_pfid) for str_pfid in publishedfileids],
                             ]
                         )
                     return True
@@ -1230,7 +1230,7 @@ class ModListWidget(QListWidget):
                         self.steamworks_subscription_signal.emit(
                             [
                                 "取消订阅",
-                                [eval(str_pfid) for str_pfid in publishedfileids],
+                                [int(str_pfid) for str_pfid in publishedfileids],
                             ]
                         )
                     return True
@@ -2014,6 +2014,8 @@ class ModsPanel(QWidget):
             "Showing SteamCMD Mods",
             "Showing Steam Mods",
         ]
+        # Index past the last filter; cycling from it wraps back to "Showing All Mods"
+        self.default_filter_index = len(self.data_source_filter_icons)
 
         self.mode_filter_icon = QIcon(
             str(AppInfo().theme_data_folder / "default-icons" / "filter.png")
@@ -2425,6 +2427,20 @@ class ModsPanel(QWidget):
         # Filter widgets by data source, while preserving any active search pattern
         self.signal_search_and_filters(list_type=list_type, pattern=search.text())
 
+    def reset_both_filters_to_all(self) -> None:
+        """
+        Clear the search and reset the data source filter to show all mods,
+        for both the active and inactive mod lists.
+        """
+        # The source filter steps forward from the stored index, which wraps
+        # the default index around to the first ("all") filter
+        self.signal_clear_search(list_type="Active")
+        self.active_mods_filter_data_source_index = self.default_filter_index
+        self.signal_search_source_filter(list_type="Active")
+        self.signal_clear_search(list_type="Inactive")
+        self.inactive_mods_filter_data_source_index = self.default_filter_index
+        self.signal_search_source_filter(list_type="Inactive")
+
     def update_count(self, list_type: str) -> None:
         # Calculate filtered items
         label = (
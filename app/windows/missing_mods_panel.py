@@ -19,6 +19,57 @@ from PySide6.QtWidgets import (
 from app.utils.constants import RIMWORLD_DLC_METADATA
 
 
+def build_missing_mods_variants(
+    packageids: list[str], steam_workshop_metadata: Dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Look up the available Steam Workshop variant(s) of each missing mod.
+    This does not touch any widgets, so it is safe to run off the UI thread.
+
+    :param packageids: list of missing mod packageids
+    :param steam_workshop_metadata: user-configured Steam metadata to search
+    :return: dict of {packageid: {publishedfileid: variant data}}
+    """
+    data_by_variants: dict[str, Any] = {}
+    if not steam_workshop_metadata or len(steam_workshop_metadata.keys()) == 0:
+        return data_by_variants
+    missing_packageids = set(packageids)
+    # Generate a list of all missing mods + any missing mod dependencies listed
+    # in the user-configured Steam metadata.
+    for publishedfileid, metadata in steam_workshop_metadata.items():
+        packageid = metadata.get("packageId", "None").lower()
+        if packageid not in missing_packageids:
+            continue
+        name = metadata.get("steamName", metadata.get("name", "Not found"))
+        gameVersions = metadata.get("gameVersions", ["None listed"])
+
+        # Remove AppId dependencies from this dict. They cannot be subscribed like mods.
+        dependencies = {
+            key: value
+            for key, value in metadata.get("dependencies", {}).items()
+            if key not in RIMWORLD_DLC_METADATA.keys()
+        }
+
+        # Populate data_by_variants dict
+        variants = data_by_variants.setdefault(packageid, {})
+        variants[publishedfileid] = {
+            "name": name,
+            "gameVersions": gameVersions,
+            "dependencies": dependencies,
+        }
+
+    # If we couldn't find any from Steam metadata, we still want to populate a blank row for user input
+    for packageid in packageids:
+        if packageid not in data_by_variants.keys():
+            data_by_variants[packageid] = {
+                "": {
+                    "name": "Not found",
+                    "gameVersions": ["None listed"],
+                }
+            }
+    return data_by_variants
+
+
 class MissingModsPrompt(QWidget):
     """
     A generic panel used to prompt a user to download missing mods
@@ -216,59 +267,33 @@ class MissingModsPrompt(QWidget):
             self.steamworks_subscription_signal.emit(
                 [
                     "subscribe",
-                    [eval(str_pfid) for str_pfid in publishedfileids],
+                    [int(str_pfid) for str_pfid in publishedfileids],
                 ]
             )
 
     def _populate_from_metadata(self) -> None:
         # Build a dict of missing mod variant(s)
-        if (
-            self.steam_workshop_metadata
-            and len(self.steam_workshop_metadata.keys()) > 0
-        ):
-            # Generate a list of all missing mods + any missing mod dependencies listed
-            # in the user-configured Steam metadata.
-            for publishedfileid, metadata in self.steam_workshop_metadata.items():
-                name = metadata.get("steamName", metadata.get("name", "Not found"))
-                packageid = metadata.get("packageId", "None").lower()
-                gameVersions = metadata.get("gameVersions", ["None listed"])
-
-                # Remove AppId dependencies from this dict. They cannot be subscribed like mods.
-                dependencies = {
-                    key: value
-                    for key, value in metadata.get("dependencies", {}).items()
-                    if key not in RIMWORLD_DLC_METADATA.keys()
-                }
+        self._populate_from_variants(
+            build_missing_mods_variants(self.packageids, self.steam_workshop_metadata)
+        )
+
+    def _populate_from_variants(self, data_by_variants: dict[str, Any]) -> None:
+        """
+        Populate the table from a precomputed dict of missing mod variant(s)
 
-                # Populate data_by_variants dict
-                if packageid in self.packageids:
-                    variants = self.data_by_variants.setdefault(packageid, {})
-                    variants[publishedfileid] = {
-                        "name": name,
-                        "gameVersions": gameVersions,
-                        "dependencies": dependencies,
-                    }
-
-            # If we couldn't find any from Steam metadata, we still want to populate a blank row for user input
-            for packageid in self.packageids:
-                if packageid not in self.data_by_variants.keys():
-                    self.data_by_variants[packageid] = {
-                        "": {
-                            "name": "Not found",
-                            "gameVersions": ["None listed"],
-                        }
-                    }
-
-            # Add a row for each mod variant
-            for packageid, variants in self.data_by_variants.items():
-                for publishedfileid, variant_data in variants.items():
-                    self._add_row(
-                        name=variant_data["name"],
-                        packageid=packageid,
-                        gameVersions=variant_data["gameVersions"],
-                        mod_variants=str(len(variants.keys())),
-                        publishedfileid=publishedfileid,
-                    )
+        :param data_by_variants: dict as returned by build_missing_mods_variants
+        """
+        self.data_by_variants = data_by_variants
+        # Add a row for each mod variant
+        for packageid, variants in self.data_by_variants.items():
+            for publishedfileid, variant_data in variants.items():
+                self._add_row(
+                    name=variant_data["name"],
+                    packageid=packageid,
+                    gameVersions=variant_data["gameVersions"],
+                    mod_variants=str(len(variants.keys())),
+                    publishedfileid=publishedfileid,
+                )
 
     def _update_mod_info(self, publishedfileid: str) -> None:
         combo_box = self.sender()
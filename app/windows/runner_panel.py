@@ -1,11 +1,12 @@
 import os
+from collections import deque
 from platform import system
 from re import compile, search
 from typing import Any, Sequence
 
 import psutil
 from loguru import logger
-from PySide6.QtCore import QProcess, Qt, Signal
+from PySide6.QtCore import QProcess, Qt, QTimer, Signal
 from PySide6.QtGui import QCloseEvent, QFont, QIcon, QKeyEvent, QTextCursor
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -50,6 +51,13 @@ class RunnerPanel(QWidget):
         self.steamcmd_download_tracking = steamcmd_download_tracking
         self.steam_db = steam_db
 
+        # Messages queued from worker threads, flushed to the runner in batches
+        self.message_queue: deque[str] = deque()
+        self.message_flush_timer = QTimer(self)
+        self.message_flush_timer.setSingleShot(True)
+        self.message_flush_timer.setInterval(16)
+        self.message_flush_timer.timeout.connect(self._do_flush_message_queue)
+
         # The "runner"
         self.text = QPlainTextEdit()
         self.text.verticalScrollBar().setValue(self.text.verticalScrollBar().maximum())
@@ -153,6 +161,26 @@ class RunnerPanel(QWidget):
     def _do_clear_runner(self) -> None:
         self.text.clear()
 
+    def _do_flush_message_queue(self) -> None:
+        lines = []
+        while self.message_queue:
+            lines.append(self.message_queue.popleft())
+        self.message_batch(lines)
+
+    def reset(self) -> None:
+        """
+        Clear output and progress so the panel can be reused for another run
+        """
+        self.message_flush_timer.stop()
+        self.message_queue.clear()
+        self._do_clear_runner()
+        self.previous_line = ""
+        self.progress_bar.setValue(0)
+        self.progress_bar.hide()
+        self.change_progress_bar_color("default")
+        self.restart_process_button.hide()
+        self.kill_process_button.hide()
+
     def _do_kill_process(self) -> None:
         if self.process and self.process.state() == QProcess.ProcessState.Running:
             # Terminate the main process and its child processes
@@ -240,6 +268,33 @@ class RunnerPanel(QWidget):
         stdout = self.ansi_escape.sub("", bytes(data.data()).decode("utf8"))
         self.message(stdout)
 
+    def queue_message(self, line: str) -> None:
+        """
+        Queue a line to be shown with the next batch, at most one batch per frame
+
+        Use this for chatty sources, such as the DB Builder, instead of message().
+
+        :param line: the line to show
+        """
+        self.message_queue.append(line)
+        if not self.message_flush_timer.isActive():
+            self.message_flush_timer.start()
+
+    def message_batch(self, lines: list[str]) -> None:
+        """
+        Show several lines, repainting the runner once rather than per line
+
+        :param lines: the lines to show, in order
+        """
+        if not lines:
+            return
+        self.text.setUpdatesEnabled(False)
+        try:
+            for line in lines:
+                self.message(line)
+        finally:
+            self.text.setUpdatesEnabled(True)
+
     def message(self, line: str) -> None:
         overwrite = False
         if self.process and self.process.state() == QProcess.ProcessState.Running:
@@ -215,7 +215,7 @@ class ModUpdaterPrompt(QWidget):
             self.steamworks_subscription_signal.emit(
                 [
                     "resubscribe",
-                    [eval(str_pfid) for str_pfid in steam_publishedfileids],
+                    [int(str_pfid) for str_pfid in steam_publishedfileids],
                 ]
             )
         self.close()
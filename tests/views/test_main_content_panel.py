@@ -0,0 +1,40 @@
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("PySide6")
+pytest.importorskip("msgspec")
+MainContent = pytest.importorskip("app.views.main_content_panel").MainContent
+
+
+def _fake_animation(target: Callable[..., Any], **kwargs: Any) -> Any:
+    # Mirrors LoadingAnimation/WorkThread: a failed target is logged and {} returned
+    data: Any = {}
+    try:
+        result = target()
+    except ValueError:
+        return data
+    return result if result else data
+
+
+def _fake_main_content() -> Any:
+    return SimpleNamespace(do_threaded_loading_animation=_fake_animation)
+
+
+def test__do_database_io_returns_none_when_target_raises() -> None:
+    def target() -> Any:
+        raise ValueError("cannot mmap an empty file")
+
+    assert MainContent._do_database_io(_fake_main_content(), target, "") is None
+
+
+def test__do_database_io_returns_target_result() -> None:
+    assert MainContent._do_database_io(
+        _fake_main_content(), lambda: [{"a": 1}, {"b": 2}], ""
+    ) == [{"a": 1}, {"b": 2}]
+
+
+def test__do_database_io_keeps_empty_result() -> None:
+    assert MainContent._do_database_io(_fake_main_content(), dict, "") == {}